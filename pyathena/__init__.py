@@ -35,14 +35,16 @@ class DBAPITypeObject(frozenset[str]):
     """
 
     def __eq__(self, other: object):
+        # Comparing against a type name (e.g. ``description[i][1] == STRING``)
+        # is by far the most common case, so check for it first.
+        if type(other) is str:
+            return other in self
         if isinstance(other, frozenset):
             return frozenset.__eq__(self, other)
         return other in self
 
     def __ne__(self, other: object):
-        if isinstance(other, frozenset):
-            return frozenset.__ne__(self, other)
-        return other not in self
+        return not self.__eq__(other)
 
     def __hash__(self):
         return frozenset.__hash__(self)
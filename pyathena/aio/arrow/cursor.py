@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import asyncio
+import functools
 import logging
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Any, cast
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any
 
 from pyathena.aio.common import WithAsyncFetch
 from pyathena.arrow.converter import (
@@ -18,7 +18,7 @@ from pyathena.options import ExecuteOptions
 
 if TYPE_CHECKING:
     import polars as pl
-    from pyarrow import Table
+    from pyarrow import RecordBatch, Table
 
 _logger = logging.getLogger(__name__)
 
@@ -26,8 +26,13 @@ _logger = logging.getLogger(__name__)
 class AioArrowCursor(WithAsyncFetch):
     """Native asyncio cursor that returns results as Apache Arrow Tables.
 
-    Uses ``asyncio.to_thread()`` for both result set creation and fetch
-    operations, keeping the event loop free.
+    Result set creation (S3 reads and Arrow decoding) and fetch operations
+    run on the connection's thread pool, keeping the event loop free
+    without competing with other work on the loop's default executor.
+
+    Passing ``prefetch=False`` to ``execute()`` defers downloading the results
+    until ``materialize()`` or a fetch method is awaited, so several queries
+    can be awaited together without serializing on their downloads.
 
     Example:
         >>> async with await pyathena.aio_connect(...) as conn:
@@ -94,6 +99,7 @@ class AioArrowCursor(WithAsyncFetch):
         result_set_type_hints: dict[str | int, str] | None = None,
         *,
         options: ExecuteOptions | None = None,
+        prefetch: bool = True,
         **kwargs,
     ) -> AioArrowCursor:
         """Execute a SQL query asynchronously and return results as Arrow Tables.
@@ -115,6 +121,13 @@ class AioArrowCursor(WithAsyncFetch):
             options: Shared execution options as an
                 :class:`~pyathena.options.ExecuteOptions` instance. Individual
                 keyword arguments take precedence over ``options`` fields.
+            prefetch: Download and decode the results before returning. If False,
+                this is deferred until ``materialize()`` or an async fetch method
+                is awaited. Until then, ``result_set``, the result metadata
+                properties (``description``, ``rowcount``, ``state`` and so on),
+                ``as_arrow()``, ``as_polars()`` and ``iter_batches()`` raise
+                ``ProgrammingError`` rather than loading the results on the
+                event loop.
             **kwargs: Additional execution parameters.
 
         Returns:
@@ -145,7 +158,7 @@ class AioArrowCursor(WithAsyncFetch):
 
         query_execution = await self._poll(self.query_id)
         if query_execution.state == AthenaQueryExecution.STATE_SUCCEEDED:
-            self.result_set = await asyncio.to_thread(
+            self._result_set_factory = functools.partial(
                 AthenaArrowResultSet,
                 connection=self._connection,
                 converter=self._converter,
@@ -159,6 +172,8 @@ class AioArrowCursor(WithAsyncFetch):
                 result_set_type_hints=options.result_set_type_hints,
                 **kwargs,
             )
+            if prefetch:
+                await self.materialize()
         else:
             raise OperationalError(query_execution.state_change_reason)
         return self
@@ -168,8 +183,10 @@ class AioArrowCursor(WithAsyncFetch):
     ) -> tuple[Any | None, ...] | dict[Any, Any | None] | None:
         """Fetch the next row of the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` to avoid
-        blocking the event loop.
+        Converting the next record batch to rows runs on the cursor's thread
+        pool to avoid blocking the event loop. Rows already converted are
+        returned directly, so iterating row by row costs one thread hop per
+        batch rather than one per row.
 
         Returns:
             A tuple representing the next row, or None if no more rows.
@@ -177,17 +194,20 @@ class AioArrowCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        await self.materialize()
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaArrowResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchone)
+        if result_set.needs_fetch():
+            await self._run_in_executor(result_set.fetch_next_batch)
+        return result_set.fetchone()
 
     async def fetchmany(  # type: ignore[override]
         self, size: int | None = None
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
         """Fetch multiple rows from the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` to avoid
+        Runs the synchronous fetch on the connection's thread pool to avoid
         blocking the event loop.
 
         Args:
@@ -199,17 +219,18 @@ class AioArrowCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        await self.materialize()
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaArrowResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchmany, size)
+        return await self._run_in_executor(result_set.fetchmany, size)
 
     async def fetchall(  # type: ignore[override]
         self,
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
         """Fetch all remaining rows from the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` to avoid
+        Runs the synchronous fetch on the connection's thread pool to avoid
         blocking the event loop.
 
         Returns:
@@ -218,10 +239,11 @@ class AioArrowCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        await self.materialize()
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaArrowResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchall)
+        return await self._run_in_executor(result_set.fetchall)
 
     async def __anext__(self):
         row = await self.fetchone()
@@ -235,18 +257,38 @@ class AioArrowCursor(WithAsyncFetch):
         Returns:
             Apache Arrow Table containing all query results.
         """
-        if not self.has_result_set:
+        self._check_materialized()
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaArrowResultSet, self.result_set)
         return result_set.as_arrow()
 
+    def iter_batches(self, batch_size: int | None = None) -> Iterator[RecordBatch]:
+        """Iterate over query results as Apache Arrow RecordBatches.
+
+        Batches are zero-copy slices of the result Table and no per-row Python
+        objects are created.
+
+        Args:
+            batch_size: Maximum number of rows per batch. Defaults to arraysize.
+
+        Returns:
+            Iterator of RecordBatches covering all query results.
+        """
+        self._check_materialized()
+        result_set = self._result_set
+        if result_set is None:
+            raise ProgrammingError("No result set.")
+        return result_set.iter_batches(batch_size)
+
     def as_polars(self) -> pl.DataFrame:
         """Return query results as a Polars DataFrame.
 
         Returns:
             Polars DataFrame containing all query results.
         """
-        if not self.has_result_set:
+        self._check_materialized()
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaArrowResultSet, self.result_set)
         return result_set.as_polars()
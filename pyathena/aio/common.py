@@ -1,12 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import contextvars
+import functools
 import logging
+import random
 import sys
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor
+from dataclasses import fields
 from datetime import datetime, timedelta, timezone
-from typing import Any, cast
+from typing import Any, TypeVar
 
-from pyathena.aio.util import async_retry_api_call
+from pyathena.aio.util import async_retry_api_call, discard_pending, get_executor
 from pyathena.common import BaseCursor, CursorIterator
 from pyathena.error import DatabaseError, OperationalError, ProgrammingError
 from pyathena.model import AthenaDatabase, AthenaQueryExecution, AthenaTableMetadata
@@ -15,15 +22,58 @@ from pyathena.result_set import AthenaResultSet, WithResultSet
 
 _logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 class AioBaseCursor(BaseCursor):
     """Async base cursor that overrides I/O methods with async equivalents.
 
     Reuses ``BaseCursor.__init__``, all ``_build_*`` methods, and constants.
     Only the methods that perform network I/O or blocking sleep are overridden
-    to use ``asyncio.to_thread`` / ``asyncio.sleep``.
+    to run off the event loop or to wait without blocking it.
+
+    By default, queries are polled every ``poll_interval`` seconds, as with
+    the synchronous cursors. With ``initial_poll_interval``, polling starts at
+    that interval and doubles on each iteration up to ``poll_interval``, so
+    short queries are picked up quickly at the cost of more
+    ``GetQueryExecution`` calls; the interval starts over when the query
+    changes state (for example, from QUEUED to RUNNING). With ``poll_jitter``,
+    each wait is stretched by a random fraction of up to that value so that
+    many concurrent cursors do not poll in lockstep.
+    A pending poll wait is cut short as soon as a cancel is requested.
     """
 
+    def __init__(
+        self,
+        initial_poll_interval: float | None = None,
+        poll_jitter: float = 0.0,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._initial_poll_interval = initial_poll_interval
+        self._poll_jitter = poll_jitter
+        # Wake-up events of the polls in progress, by query ID. Each poll creates
+        # its own event so that it is bound to the running loop and so that a
+        # cancel only wakes the poll of the query it stops.
+        self._poll_wakeups: dict[str, asyncio.Event] = {}
+
+    @property
+    def _api_executor(self) -> Executor | None:
+        return get_executor(self._connection)
+
+    async def _run_in_executor(self, func: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Run a blocking call on the connection's thread pool.
+
+        Used for work such as building a result set from S3, which must not
+        block the event loop. As with ``asyncio.to_thread()``, the current
+        context variables are propagated to the worker thread.
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._api_executor, functools.partial(ctx.run, func, *args, **kwargs)
+        )
+
     async def _execute(  # type: ignore[override]
         self,
         operation: str,
@@ -72,6 +122,7 @@ class AioBaseCursor(BaseCursor):
                     self._connection.client.start_query_execution,
                     config=self._retry_config,
                     logger=_logger,
+                    executor=self._api_executor,
                     **request,
                 )
                 query_id = response.get("QueryExecutionId")
@@ -87,6 +138,7 @@ class AioBaseCursor(BaseCursor):
                 self._connection.client.get_query_execution,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
@@ -96,6 +148,20 @@ class AioBaseCursor(BaseCursor):
             return AthenaQueryExecution(response)
 
     async def __poll(self, query_id: str) -> AthenaQueryExecution:
+        wakeup = self._poll_wakeups[query_id] = asyncio.Event()
+        try:
+            return await self.__poll_until_done(query_id, wakeup)
+        finally:
+            if self._poll_wakeups.get(query_id) is wakeup:
+                del self._poll_wakeups[query_id]
+
+    async def __poll_until_done(self, query_id: str, wakeup: asyncio.Event) -> AthenaQueryExecution:
+        if self._initial_poll_interval is None:
+            initial_interval = self._poll_interval
+        else:
+            initial_interval = min(self._initial_poll_interval, self._poll_interval)
+        interval = initial_interval
+        state = None
         while True:
             query_execution = await self._get_query_execution(query_id)
             if self._on_poll:
@@ -106,7 +172,19 @@ class AioBaseCursor(BaseCursor):
                 AthenaQueryExecution.STATE_CANCELLED,
             ]:
                 return query_execution
-            await asyncio.sleep(self._poll_interval)
+            if state is not None and query_execution.state != state:
+                # A query that has just left the queue may finish quickly.
+                interval = initial_interval
+            state = query_execution.state
+            try:
+                await asyncio.wait_for(
+                    wakeup.wait(),
+                    timeout=interval * (1 + random.uniform(0, self._poll_jitter)),
+                )
+            except asyncio.TimeoutError:
+                interval = min(interval * 2, self._poll_interval)
+            else:
+                wakeup.clear()
 
     async def _poll(self, query_id: str) -> AthenaQueryExecution:  # type: ignore[override]
         try:
@@ -127,11 +205,17 @@ class AioBaseCursor(BaseCursor):
                 self._connection.client.stop_query_execution,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
             _logger.exception("Failed to cancel query.")
             raise OperationalError(*e.args) from e
+        # Wake up a concurrent poll of this query so it observes the cancellation
+        # right away.
+        wakeup = self._poll_wakeups.get(query_id)
+        if wakeup is not None:
+            wakeup.set()
 
     async def _batch_get_query_execution(  # type: ignore[override]
         self, query_ids: list[str]
@@ -141,6 +225,7 @@ class AioBaseCursor(BaseCursor):
                 self.connection._client.batch_get_query_execution,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 QueryExecutionIds=query_ids,
             )
         except Exception as e:
@@ -152,12 +237,12 @@ class AioBaseCursor(BaseCursor):
                 for r in response.get("QueryExecutions", [])
             ]
 
-    async def _list_query_executions(  # type: ignore[override]
+    async def _list_query_execution_ids(
         self,
         work_group: str | None = None,
         next_token: str | None = None,
         max_results: int | None = None,
-    ) -> tuple[str | None, list[AthenaQueryExecution]]:
+    ) -> tuple[str | None, list[str]]:
         request = self._build_list_query_executions_request(
             work_group=work_group, next_token=next_token, max_results=max_results
         )
@@ -166,17 +251,27 @@ class AioBaseCursor(BaseCursor):
                 self.connection._client.list_query_executions,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
             _logger.exception("Failed to list query executions.")
             raise OperationalError(*e.args) from e
         else:
-            next_token = response.get("NextToken")
-            query_ids = response.get("QueryExecutionIds")
-            if not query_ids:
-                return next_token, []
-            return next_token, await self._batch_get_query_execution(query_ids)
+            return response.get("NextToken"), response.get("QueryExecutionIds") or []
+
+    async def _list_query_executions(  # type: ignore[override]
+        self,
+        work_group: str | None = None,
+        next_token: str | None = None,
+        max_results: int | None = None,
+    ) -> tuple[str | None, list[AthenaQueryExecution]]:
+        next_token, query_ids = await self._list_query_execution_ids(
+            work_group, next_token=next_token, max_results=max_results
+        )
+        if not query_ids:
+            return next_token, []
+        return next_token, await self._batch_get_query_execution(query_ids)
 
     async def _find_previous_query_id(  # type: ignore[override]
         self,
@@ -192,13 +287,33 @@ class AioBaseCursor(BaseCursor):
             expiration_time = datetime.now(timezone.utc) - timedelta(seconds=cache_expiration_time)
         else:
             expiration_time = datetime.now(timezone.utc)
+        # Compared as POSIX timestamps, which avoids converting the completion
+        # time of every candidate execution to UTC.
+        expiration_timestamp = expiration_time.timestamp()
+        # The next page of query ids is requested while the details of the current
+        # page are fetched and scanned, overlapping the two API round-trips.
+        pending: asyncio.Future[tuple[str | None, list[str]]] | None = None
         try:
             next_token = None
-            while cache_size > 0:
+            if cache_size > 0:
                 max_results = min(cache_size, self.LIST_QUERY_EXECUTIONS_MAX_RESULTS)
                 cache_size -= max_results
-                next_token, query_executions = await self._list_query_executions(
-                    work_group, next_token=next_token, max_results=max_results
+                pending = asyncio.ensure_future(
+                    self._list_query_execution_ids(work_group, max_results=max_results)
+                )
+            while pending is not None:
+                next_token, query_ids = await pending
+                pending = None
+                if next_token is not None and cache_size > 0:
+                    max_results = min(cache_size, self.LIST_QUERY_EXECUTIONS_MAX_RESULTS)
+                    cache_size -= max_results
+                    pending = asyncio.ensure_future(
+                        self._list_query_execution_ids(
+                            work_group, next_token=next_token, max_results=max_results
+                        )
+                    )
+                query_executions = (
+                    await self._batch_get_query_execution(query_ids) if query_ids else []
                 )
                 for execution in sorted(
                     (
@@ -213,8 +328,7 @@ class AioBaseCursor(BaseCursor):
                     if (
                         cache_expiration_time > 0
                         and execution.completion_date_time
-                        and execution.completion_date_time.astimezone(timezone.utc)
-                        < expiration_time
+                        and execution.completion_date_time.timestamp() < expiration_timestamp
                     ):
                         next_token = None
                         break
@@ -229,8 +343,28 @@ class AioBaseCursor(BaseCursor):
                     break
         except Exception:
             _logger.warning("Failed to check the cache. Moving on without cache.", exc_info=True)
+        finally:
+            discard_pending(pending)
         return query_id
 
+    @staticmethod
+    async def _iter_pages(
+        fetch_page: Callable[[str | None], Awaitable[tuple[str | None, list[_T]]]],
+    ) -> AsyncIterator[_T]:
+        # The next page is requested as soon as the current one arrives, so its
+        # round-trip overlaps with the caller consuming the current page.
+        pending: asyncio.Future[tuple[str | None, list[_T]]] | None = asyncio.ensure_future(
+            fetch_page(None)
+        )
+        try:
+            while pending is not None:
+                next_token, items = await pending
+                pending = asyncio.ensure_future(fetch_page(next_token)) if next_token else None
+                for item in items:
+                    yield item
+        finally:
+            discard_pending(pending)
+
     async def _list_databases(  # type: ignore[override]
         self,
         catalog_name: str | None,
@@ -247,6 +381,7 @@ class AioBaseCursor(BaseCursor):
                 self.connection._client.list_databases,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
@@ -275,6 +410,32 @@ class AioBaseCursor(BaseCursor):
                 break
         return databases
 
+    async def iter_databases(
+        self,
+        catalog_name: str | None,
+        max_results: int | None = None,
+    ) -> AsyncIterator[AthenaDatabase]:
+        """Iterate over the databases in a catalog, page by page.
+
+        Unlike ``list_databases()``, databases are yielded as each page arrives,
+        and the next page is requested while the current one is being consumed.
+
+        Args:
+            catalog_name: Name of the data catalog.
+            max_results: Maximum number of databases per API request.
+
+        Yields:
+            The databases in the catalog.
+        """
+        async for database in self._iter_pages(
+            lambda next_token: self._list_databases(
+                catalog_name=catalog_name,
+                next_token=next_token,
+                max_results=max_results,
+            )
+        ):
+            yield database
+
     async def _get_table_metadata(  # type: ignore[override]
         self,
         table_name: str,
@@ -292,6 +453,7 @@ class AioBaseCursor(BaseCursor):
                 self._connection.client.get_table_metadata,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
@@ -335,6 +497,7 @@ class AioBaseCursor(BaseCursor):
                 self.connection._client.list_table_metadata,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
@@ -368,6 +531,39 @@ class AioBaseCursor(BaseCursor):
                 break
         return metadata
 
+    async def iter_table_metadata(
+        self,
+        catalog_name: str | None = None,
+        schema_name: str | None = None,
+        expression: str | None = None,
+        max_results: int | None = None,
+    ) -> AsyncIterator[AthenaTableMetadata]:
+        """Iterate over the metadata of the tables in a schema, page by page.
+
+        Unlike ``list_table_metadata()``, tables are yielded as each page
+        arrives, and the next page is requested while the current one is being
+        consumed.
+
+        Args:
+            catalog_name: Name of the data catalog. Defaults to the cursor's catalog.
+            schema_name: Name of the schema. Defaults to the cursor's schema.
+            expression: Regular expression to filter table names.
+            max_results: Maximum number of tables per API request.
+
+        Yields:
+            The metadata of the matching tables.
+        """
+        async for table_metadata in self._iter_pages(
+            lambda next_token: self._list_table_metadata(
+                catalog_name=catalog_name,
+                schema_name=schema_name,
+                expression=expression,
+                next_token=next_token,
+                max_results=max_results,
+            )
+        ):
+            yield table_metadata
+
 
 class WithAsyncFetch(AioBaseCursor, CursorIterator, WithResultSet):
     """Mixin providing shared fetch, lifecycle, and async protocol for SQL cursors.
@@ -378,13 +574,16 @@ class WithAsyncFetch(AioBaseCursor, CursorIterator, WithResultSet):
     data eagerly in ``__init__``), and the async iteration protocol.
 
     Subclasses override ``execute()`` and optionally ``__init__`` and
-    format-specific helpers.
+    format-specific helpers. A subclass whose ``execute()`` accepts
+    ``prefetch=False`` stores a ``_result_set_factory`` instead of building the
+    result set; it is built on the connection's thread pool by ``materialize()``.
     """
 
     def __init__(self, **kwargs) -> None:
         super().__init__(**kwargs)
         self._query_id: str | None = None
         self._result_set: AthenaResultSet | None = None
+        self._result_set_factory: Callable[[], AthenaResultSet] | None = None
 
     @property
     def arraysize(self) -> int:
@@ -398,12 +597,31 @@ class WithAsyncFetch(AioBaseCursor, CursorIterator, WithResultSet):
 
     @property  # type: ignore[override]
     def result_set(self) -> AthenaResultSet | None:
+        self._check_materialized()
         return self._result_set
 
     @result_set.setter
     def result_set(self, val) -> None:
         self._result_set = val
 
+    @property
+    def has_result_set(self) -> bool:
+        return self._result_set is not None or self._result_set_factory is not None
+
+    def _check_materialized(self) -> None:
+        if self._result_set_factory is not None:
+            raise ProgrammingError("Result set not materialized; await cursor.materialize()")
+
+    async def materialize(self) -> None:
+        """Download and decode results deferred by ``execute(prefetch=False)``.
+
+        The work runs on the connection's thread pool. Does nothing if the
+        results are already loaded.
+        """
+        if self._result_set_factory is not None:
+            self._result_set = await self._run_in_executor(self._result_set_factory)
+            self._result_set_factory = None
+
     @property
     def query_id(self) -> str | None:
         return self._query_id
@@ -420,8 +638,13 @@ class WithAsyncFetch(AioBaseCursor, CursorIterator, WithResultSet):
     def rowcount(self) -> int:
         return self.result_set.rowcount if self.result_set else -1
 
+    def _reset_state(self) -> None:
+        self._result_set_factory = None
+        super()._reset_state()
+
     def close(self) -> None:
         """Close the cursor and release associated resources."""
+        self._result_set_factory = None
         if self.result_set and not self.result_set.is_closed:
             self.result_set.close()
 
@@ -429,20 +652,104 @@ class WithAsyncFetch(AioBaseCursor, CursorIterator, WithResultSet):
         self,
         operation: str,
         seq_of_parameters: list[dict[str, Any] | list[str] | None],
+        *,
+        max_concurrency: int = 1,
         **kwargs,
     ) -> None:
         """Execute a SQL query multiple times with different parameters.
 
+        By default the queries run one after another. With ``max_concurrency``
+        greater than 1, up to that many queries are submitted and polled at the
+        same time; only use this when the statements do not depend on each
+        other's effects (for example, concurrent writes to the same Iceberg
+        table can fail with commit conflicts). If any query fails, the queries
+        that have not been submitted yet are skipped, the ones still running are
+        stopped with ``StopQueryExecution``, and the error is raised.
+
         Args:
             operation: SQL query string to execute.
             seq_of_parameters: Sequence of parameter sets, one per execution.
+            max_concurrency: Maximum number of queries to run at once.
             **kwargs: Additional keyword arguments passed to each ``execute()``.
+                With ``max_concurrency`` greater than 1, no result set is
+                created, so only ``options`` and the fields of
+                :class:`~pyathena.options.ExecuteOptions` are accepted.
+
+        Raises:
+            ProgrammingError: If ``max_concurrency`` is greater than 1 and other
+                keyword arguments are given.
         """
-        for parameters in seq_of_parameters:
-            await self.execute(operation, parameters, **kwargs)
+        if max_concurrency <= 1:
+            for parameters in seq_of_parameters:
+                await self.execute(operation, parameters, **kwargs)
+        else:
+            unsupported = sorted(
+                kwargs.keys() - {"options"} - {f.name for f in fields(ExecuteOptions)}
+            )
+            if unsupported:
+                raise ProgrammingError(
+                    "executemany() with max_concurrency does not support the keyword "
+                    f"arguments: {', '.join(unsupported)}"
+                )
+            self._reset_state()
+            options = ExecuteOptions.resolve(
+                kwargs.get("options"),
+                **{f.name: kwargs.get(f.name) for f in fields(ExecuteOptions)},
+            )
+            semaphore = asyncio.Semaphore(max_concurrency)
+            running: set[str] = set()
+
+            async def _execute_one(parameters: dict[str, Any] | list[str] | None) -> None:
+                async with semaphore:
+                    await self._execute_without_result_set(operation, parameters, options, running)
+
+            tasks = [asyncio.ensure_future(_execute_one(p)) for p in seq_of_parameters]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                # Cancelling a task only stops waiting for its query; stop the query too.
+                await asyncio.gather(
+                    *(self._cancel(query_id) for query_id in running), return_exceptions=True
+                )
+                raise
         # Operations that have result sets are not allowed with executemany.
         self._reset_state()
 
+    async def _execute_without_result_set(
+        self,
+        operation: str,
+        parameters: dict[str, Any] | list[str] | None,
+        options: ExecuteOptions,
+        running: set[str],
+    ) -> None:
+        """Run a query to completion without touching the cursor's state.
+
+        Used by ``executemany()`` to run queries concurrently; the result set is
+        never created because ``executemany()`` discards it anyway. The query ID
+        is kept in ``running`` until the query finishes, so that the caller can
+        stop the query if this coroutine is cancelled.
+        """
+        operation, _ = self._prepare_unload(operation, options.s3_staging_dir)
+        start = asyncio.ensure_future(
+            self._execute(operation, parameters=parameters, options=options)
+        )
+        try:
+            query_id = await asyncio.shield(start)
+        except asyncio.CancelledError:
+            # The query may be started anyway; wait for its ID so that it can be stopped.
+            with contextlib.suppress(Exception):
+                running.add(await start)
+            raise
+        running.add(query_id)
+        self._call_on_start_query_execution(query_id, options)
+        query_execution = await self._poll(query_id)
+        running.discard(query_id)
+        if query_execution.state != AthenaQueryExecution.STATE_SUCCEEDED:
+            raise OperationalError(query_execution.state_change_reason)
+
     async def cancel(self) -> None:
         """Cancel the currently executing query.
 
@@ -464,9 +771,9 @@ class WithAsyncFetch(AioBaseCursor, CursorIterator, WithResultSet):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        result_set = self.result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaResultSet, self.result_set)
         return result_set.fetchone()
 
     def fetchmany(
@@ -483,9 +790,9 @@ class WithAsyncFetch(AioBaseCursor, CursorIterator, WithResultSet):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        result_set = self.result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaResultSet, self.result_set)
         return result_set.fetchmany(size)
 
     def fetchall(
@@ -499,9 +806,9 @@ class WithAsyncFetch(AioBaseCursor, CursorIterator, WithResultSet):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        result_set = self.result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaResultSet, self.result_set)
         return result_set.fetchall()
 
     def __aiter__(self):
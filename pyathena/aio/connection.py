@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from concurrent.futures.thread import ThreadPoolExecutor
 from typing import Any
 
 from pyathena.aio.cursor import AioCursor
@@ -13,6 +14,12 @@ class AioConnection(Connection[AioCursor]):
     Wraps the synchronous ``Connection`` with async context manager support
     and provides ``create()`` for non-blocking initialization.
 
+    The blocking work of its cursors, boto3 API calls as well as reading
+    result files from S3, runs on a thread pool owned by the connection
+    rather than on the event loop's default executor, so it neither competes
+    with other work on the loop nor is limited by its size. ``max_workers``
+    bounds the number of these calls in flight at once.
+
     Example:
         >>> async with await AioConnection.create(
         ...     s3_staging_dir="s3://bucket/path/",
@@ -23,10 +30,18 @@ class AioConnection(Connection[AioCursor]):
         ...         print(await cursor.fetchone())
     """
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(self, max_workers: int | None = None, **kwargs: Any) -> None:
         if "cursor_class" not in kwargs:
             kwargs["cursor_class"] = AioCursor
         super().__init__(**kwargs)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pyathena-aio"
+        )
+
+    def close(self) -> None:
+        """Close the connection and shut down its thread pool."""
+        super().close()
+        self._executor.shutdown(wait=False)
 
     @classmethod
     async def create(
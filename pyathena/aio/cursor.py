@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
-from typing import Any, cast
+from typing import Any
 
 from pyathena.aio.common import WithAsyncFetch
 from pyathena.aio.result_set import AthenaAioDictResultSet, AthenaAioResultSet
@@ -18,8 +18,8 @@ class AioCursor(WithAsyncFetch):
     """Native asyncio cursor for Amazon Athena.
 
     Unlike ``AsyncCursor`` (which uses ``ThreadPoolExecutor``), this cursor
-    uses ``asyncio.sleep`` for polling and ``asyncio.to_thread`` for boto3
-    calls, keeping the event loop free.
+    waits between polls on the event loop and runs boto3 calls on the
+    connection's thread pool, keeping the event loop free.
 
     Example:
         >>> async with AioConnection.create(...) as conn:
@@ -159,9 +159,9 @@ class AioCursor(WithAsyncFetch):
             ProgrammingError: If called before executing a query that
                 returns results.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaAioResultSet, self.result_set)
         return await result_set.fetchone()
 
     async def fetchmany(  # type: ignore[override]
@@ -179,9 +179,9 @@ class AioCursor(WithAsyncFetch):
             ProgrammingError: If called before executing a query that
                 returns results.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaAioResultSet, self.result_set)
         return await result_set.fetchmany(size)
 
     async def fetchall(  # type: ignore[override]
@@ -196,9 +196,9 @@ class AioCursor(WithAsyncFetch):
             ProgrammingError: If called before executing a query that
                 returns results.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaAioResultSet, self.result_set)
         return await result_set.fetchall()
 
     async def __anext__(self):
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
-import asyncio
+import functools
 import logging
-from collections.abc import Callable, Iterable
+from collections.abc import AsyncIterator, Callable, Iterable
 from multiprocessing import cpu_count
 from typing import (
     TYPE_CHECKING,
     Any,
-    cast,
 )
 
 from pyathena.aio.common import WithAsyncFetch
@@ -30,9 +29,15 @@ _logger = logging.getLogger(__name__)
 class AioPandasCursor(WithAsyncFetch):
     """Native asyncio cursor that returns results as pandas DataFrames.
 
-    Uses ``asyncio.to_thread()`` for both result set creation and fetch
-    operations, keeping the event loop free. This is especially important
-    when ``chunksize`` is set, as fetch calls trigger lazy S3 reads.
+    Result set creation and fetch operations run on the connection's thread
+    pool, keeping the event loop free without competing with other work on
+    the loop's default executor. This is especially important when
+    ``chunksize`` is set, as fetch calls trigger lazy S3 reads.
+
+    Passing ``prefetch=False`` to ``execute()`` defers reading the results
+    until ``materialize()``, a fetch method or ``iter_chunks()`` is awaited, so
+    several queries can be awaited together without serializing on their
+    downloads.
 
     Example:
         >>> async with await pyathena.aio_connect(...) as conn:
@@ -87,7 +92,7 @@ class AioPandasCursor(WithAsyncFetch):
     @staticmethod
     def get_default_converter(
         unload: bool = False,
-    ) -> DefaultPandasTypeConverter | Any:
+    ) -> DefaultPandasTypeConverter | DefaultPandasUnloadTypeConverter | Any:
         if unload:
             return DefaultPandasUnloadTypeConverter()
         return DefaultPandasTypeConverter()
@@ -110,6 +115,7 @@ class AioPandasCursor(WithAsyncFetch):
         result_set_type_hints: dict[str | int, str] | None = None,
         *,
         options: ExecuteOptions | None = None,
+        prefetch: bool = True,
         **kwargs,
     ) -> AioPandasCursor:
         """Execute a SQL query asynchronously and return results as pandas DataFrames.
@@ -134,6 +140,13 @@ class AioPandasCursor(WithAsyncFetch):
             options: Shared execution options as an
                 :class:`~pyathena.options.ExecuteOptions` instance. Individual
                 keyword arguments take precedence over ``options`` fields.
+            prefetch: Read the results (or, with ``chunksize``, open the reader)
+                before returning. If False, this is deferred until
+                ``materialize()``, an async fetch method or ``iter_chunks()`` is
+                awaited. Until then, ``result_set``, the result metadata
+                properties (``description``, ``rowcount``, ``state`` and so on)
+                and ``as_pandas()`` raise ``ProgrammingError`` rather than
+                loading the results on the event loop.
             **kwargs: Additional pandas read_csv/read_parquet parameters.
 
         Returns:
@@ -164,7 +177,7 @@ class AioPandasCursor(WithAsyncFetch):
 
         query_execution = await self._poll(self.query_id)
         if query_execution.state == AthenaQueryExecution.STATE_SUCCEEDED:
-            self.result_set = await asyncio.to_thread(
+            self._result_set_factory = functools.partial(
                 AthenaPandasResultSet,
                 connection=self._connection,
                 converter=self._converter,
@@ -185,6 +198,8 @@ class AioPandasCursor(WithAsyncFetch):
                 result_set_type_hints=options.result_set_type_hints,
                 **kwargs,
             )
+            if prefetch:
+                await self.materialize()
         else:
             raise OperationalError(query_execution.state_change_reason)
         return self
@@ -194,7 +209,7 @@ class AioPandasCursor(WithAsyncFetch):
     ) -> tuple[Any | None, ...] | dict[Any, Any | None] | None:
         """Fetch the next row of the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` to avoid
+        Runs the synchronous fetch on the connection's thread pool to avoid
         blocking the event loop when ``chunksize`` triggers lazy S3 reads.
 
         Returns:
@@ -203,17 +218,18 @@ class AioPandasCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        await self.materialize()
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaPandasResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchone)
+        return await self._run_in_executor(result_set.fetchone)
 
     async def fetchmany(  # type: ignore[override]
         self, size: int | None = None
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
         """Fetch multiple rows from the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` to avoid
+        Runs the synchronous fetch on the connection's thread pool to avoid
         blocking the event loop when ``chunksize`` triggers lazy S3 reads.
 
         Args:
@@ -225,17 +241,18 @@ class AioPandasCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        await self.materialize()
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaPandasResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchmany, size)
+        return await self._run_in_executor(result_set.fetchmany, size)
 
     async def fetchall(  # type: ignore[override]
         self,
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
         """Fetch all remaining rows from the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` to avoid
+        Runs the synchronous fetch on the connection's thread pool to avoid
         blocking the event loop when ``chunksize`` triggers lazy S3 reads.
 
         Returns:
@@ -244,10 +261,11 @@ class AioPandasCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        await self.materialize()
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaPandasResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchall)
+        return await self._run_in_executor(result_set.fetchall)
 
     async def __anext__(self):
         row = await self.fetchone()
@@ -261,7 +279,37 @@ class AioPandasCursor(WithAsyncFetch):
         Returns:
             DataFrame when chunksize is None, PandasDataFrameIterator when chunksize is set.
         """
-        if not self.has_result_set:
+        self._check_materialized()
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaPandasResultSet, self.result_set)
         return result_set.as_pandas()
+
+    async def iter_chunks(self) -> AsyncIterator[DataFrame]:
+        """Iterate over DataFrame chunks without blocking the event loop.
+
+        Each chunk is read on the connection's thread pool when the next one is
+        requested. Chunks are not read ahead, so leaving the loop early does not
+        consume a chunk that a later ``iter_chunks()`` or fetch call would have
+        returned. Without ``chunksize`` (or ``auto_optimize_chunksize``), the
+        entire result is yielded as a single DataFrame.
+
+        Yields:
+            DataFrame: Individual chunks of the result set.
+
+        Raises:
+            ProgrammingError: If no result set is available.
+
+        Example:
+            >>> cursor = connection.cursor(AioPandasCursor, chunksize=50_000)
+            >>> await cursor.execute("SELECT * FROM large_table")
+            >>> async for chunk in cursor.iter_chunks():
+            ...     process_chunk(chunk)
+        """
+        await self.materialize()
+        result_set = self._result_set
+        if result_set is None:
+            raise ProgrammingError("No result set.")
+        chunks = result_set.iter_chunks()
+        while (chunk := await self._run_in_executor(next, chunks, None)) is not None:
+            yield chunk
@@ -1,10 +1,9 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Callable
 from multiprocessing import cpu_count
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any
 
 from pyathena.aio.common import WithAsyncFetch
 from pyathena.common import CursorIterator
@@ -27,9 +26,10 @@ _logger = logging.getLogger(__name__)
 class AioPolarsCursor(WithAsyncFetch):
     """Native asyncio cursor that returns results as Polars DataFrames.
 
-    Uses ``asyncio.to_thread()`` for both result set creation and fetch
-    operations, keeping the event loop free. This is especially important
-    when ``chunksize`` is set, as fetch calls trigger lazy S3 reads.
+    Result set creation and fetch operations run on the connection's thread
+    pool, keeping the event loop free without competing with other work on
+    the loop's default executor. This is especially important when
+    ``chunksize`` is set, as fetch calls trigger lazy S3 reads.
 
     Example:
         >>> async with await pyathena.aio_connect(...) as conn:
@@ -151,7 +151,7 @@ class AioPolarsCursor(WithAsyncFetch):
 
         query_execution = await self._poll(self.query_id)
         if query_execution.state == AthenaQueryExecution.STATE_SUCCEEDED:
-            self.result_set = await asyncio.to_thread(
+            self.result_set = await self._run_in_executor(
                 AthenaPolarsResultSet,
                 connection=self._connection,
                 converter=self._converter,
@@ -176,7 +176,7 @@ class AioPolarsCursor(WithAsyncFetch):
     ) -> tuple[Any | None, ...] | dict[Any, Any | None] | None:
         """Fetch the next row of the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` to avoid
+        Runs the synchronous fetch on the connection's thread pool to avoid
         blocking the event loop when ``chunksize`` triggers lazy S3 reads.
 
         Returns:
@@ -185,17 +185,17 @@ class AioPolarsCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaPolarsResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchone)
+        return await self._run_in_executor(result_set.fetchone)
 
     async def fetchmany(  # type: ignore[override]
         self, size: int | None = None
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
         """Fetch multiple rows from the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` to avoid
+        Runs the synchronous fetch on the connection's thread pool to avoid
         blocking the event loop when ``chunksize`` triggers lazy S3 reads.
 
         Args:
@@ -207,17 +207,17 @@ class AioPolarsCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaPolarsResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchmany, size)
+        return await self._run_in_executor(result_set.fetchmany, size)
 
     async def fetchall(  # type: ignore[override]
         self,
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
         """Fetch all remaining rows from the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` to avoid
+        Runs the synchronous fetch on the connection's thread pool to avoid
         blocking the event loop when ``chunksize`` triggers lazy S3 reads.
 
         Returns:
@@ -226,10 +226,10 @@ class AioPolarsCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaPolarsResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchall)
+        return await self._run_in_executor(result_set.fetchall)
 
     async def __anext__(self):
         row = await self.fetchone()
@@ -243,9 +243,9 @@ class AioPolarsCursor(WithAsyncFetch):
         Returns:
             Polars DataFrame containing all query results.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaPolarsResultSet, self.result_set)
         return result_set.as_polars()
 
     def as_arrow(self) -> Table:
@@ -254,7 +254,7 @@ class AioPolarsCursor(WithAsyncFetch):
         Returns:
             Apache Arrow Table containing all query results.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaPolarsResultSet, self.result_set)
         return result_set.as_arrow()
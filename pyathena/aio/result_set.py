@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import (
     TYPE_CHECKING,
@@ -7,7 +8,7 @@ from typing import (
     cast,
 )
 
-from pyathena.aio.util import async_retry_api_call
+from pyathena.aio.util import async_retry_api_call, discard_pending, get_executor
 from pyathena.converter import Converter
 from pyathena.error import OperationalError, ProgrammingError
 from pyathena.model import AthenaQueryExecution
@@ -15,6 +16,8 @@ from pyathena.result_set import AthenaDictResultSet, AthenaResultSet
 from pyathena.util import RetryConfig
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
     from pyathena.connection import Connection
 
 _logger = logging.getLogger(__name__)
@@ -26,6 +29,9 @@ class AthenaAioResultSet(AthenaResultSet):
     Skips the synchronous ``_pre_fetch`` by passing ``_pre_fetch=False`` to
     the parent ``__init__`` and provides an ``async create()`` classmethod
     factory instead.
+
+    Once the rows are read past the first page, the following page is
+    requested in the background while the current one is being consumed.
     """
 
     def __init__(
@@ -46,6 +52,11 @@ class AthenaAioResultSet(AthenaResultSet):
             _pre_fetch=False,
             result_set_type_hints=result_set_type_hints,
         )
+        self._pending_fetch: asyncio.Future[dict[str, Any]] | None = None
+
+    @property
+    def _api_executor(self) -> Executor | None:
+        return get_executor(self.connection)
 
     @classmethod
     async def create(
@@ -105,6 +116,7 @@ class AthenaAioResultSet(AthenaResultSet):
                 self.connection.client.get_query_results,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
@@ -119,10 +131,20 @@ class AthenaAioResultSet(AthenaResultSet):
     async def _async_fetch(self) -> None:
         if not self._next_token:
             raise ProgrammingError("NextToken is none or empty.")
-        response = await self.__async_fetch(self._next_token)
+        pending, self._pending_fetch = self._pending_fetch, None
+        if pending is None:
+            pending = asyncio.ensure_future(self.__async_fetch(self._next_token))
+        response = await pending
         rows, self._next_token = self._parse_result_rows(response)
+        if self._next_token:
+            # Request the following page while this one is being consumed.
+            self._pending_fetch = asyncio.ensure_future(self.__async_fetch(self._next_token))
         self._process_rows(rows)
 
+    def _cancel_pending_fetch(self) -> None:
+        pending, self._pending_fetch = self._pending_fetch, None
+        discard_pending(pending)
+
     async def _async_pre_fetch(self) -> None:
         response = await self.__async_fetch()
         self._process_metadata(response)
@@ -165,13 +187,16 @@ class AthenaAioResultSet(AthenaResultSet):
         """
         if not size or size <= 0:
             size = self._arraysize
-        rows = []
-        for _ in range(size):
-            row = await self.fetchone()
-            if row:
-                rows.append(row)
-            else:
-                break
+        rows: list[tuple[Any | None, ...] | dict[Any, Any | None]] = []
+        while len(rows) < size:
+            if not self._rows:
+                if not self._next_token:
+                    break
+                await self._async_fetch()
+                continue
+            count = min(size - len(rows), len(self._rows))
+            rows.extend(self._rows.popleft() for _ in range(count))
+            self._rownumber = (self._rownumber or 0) + count
         return rows
 
     async def fetchall(  # type: ignore[override]
@@ -182,15 +207,21 @@ class AthenaAioResultSet(AthenaResultSet):
         Returns:
             List of all remaining row tuples.
         """
-        rows = []
+        rows: list[tuple[Any | None, ...] | dict[Any, Any | None]] = []
         while True:
-            row = await self.fetchone()
-            if row:
-                rows.append(row)
-            else:
+            if self._rows:
+                self._rownumber = (self._rownumber or 0) + len(self._rows)
+                rows.extend(self._rows)
+                self._rows.clear()
+            if not self._next_token:
                 break
+            await self._async_fetch()
         return rows
 
+    def close(self) -> None:
+        self._cancel_pending_fetch()
+        super().close()
+
     def __aiter__(self):
         return self
 
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
-import asyncio
 import logging
 from collections.abc import Callable
-from typing import Any, cast
+from typing import Any
 
 from pyathena.aio.common import WithAsyncFetch
 from pyathena.common import CursorIterator
@@ -22,8 +21,8 @@ class AioS3FSCursor(WithAsyncFetch):
 
     Uses ``AioS3FileSystem`` for S3 operations, which replaces
     ``ThreadPoolExecutor`` parallelism with ``asyncio.gather`` +
-    ``asyncio.to_thread``. Fetch operations are wrapped in
-    ``asyncio.to_thread()`` because CSV reading is blocking I/O.
+    ``asyncio.to_thread``. Result set creation and fetch operations run on the
+    connection's thread pool because CSV reading is blocking I/O.
 
     Example:
         >>> async with await pyathena.aio_connect(...) as conn:
@@ -142,7 +141,7 @@ class AioS3FSCursor(WithAsyncFetch):
 
         query_execution = await self._poll(self.query_id)
         if query_execution.state == AthenaQueryExecution.STATE_SUCCEEDED:
-            self.result_set = await asyncio.to_thread(
+            self.result_set = await self._run_in_executor(
                 AthenaS3FSResultSet,
                 connection=self._connection,
                 converter=self._converter,
@@ -163,7 +162,7 @@ class AioS3FSCursor(WithAsyncFetch):
     ) -> tuple[Any | None, ...] | dict[Any, Any | None] | None:
         """Fetch the next row of the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` because
+        Runs the synchronous fetch on the connection's thread pool because
         ``AthenaS3FSResultSet`` reads rows lazily from S3.
 
         Returns:
@@ -172,17 +171,17 @@ class AioS3FSCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaS3FSResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchone)
+        return await self._run_in_executor(result_set.fetchone)
 
     async def fetchmany(  # type: ignore[override]
         self, size: int | None = None
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
         """Fetch multiple rows from the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` because
+        Runs the synchronous fetch on the connection's thread pool because
         ``AthenaS3FSResultSet`` reads rows lazily from S3.
 
         Args:
@@ -194,17 +193,17 @@ class AioS3FSCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaS3FSResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchmany, size)
+        return await self._run_in_executor(result_set.fetchmany, size)
 
     async def fetchall(  # type: ignore[override]
         self,
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
         """Fetch all remaining rows from the result set.
 
-        Wraps the synchronous fetch in ``asyncio.to_thread`` because
+        Runs the synchronous fetch on the connection's thread pool because
         ``AthenaS3FSResultSet`` reads rows lazily from S3.
 
         Returns:
@@ -213,10 +212,10 @@ class AioS3FSCursor(WithAsyncFetch):
         Raises:
             ProgrammingError: If no result set is available.
         """
-        if not self.has_result_set:
+        result_set = self._result_set
+        if result_set is None:
             raise ProgrammingError("No result set.")
-        result_set = cast(AthenaS3FSResultSet, self.result_set)
-        return await asyncio.to_thread(result_set.fetchall)
+        return await self._run_in_executor(result_set.fetchall)
 
     async def __anext__(self):
         row = await self.fetchone()
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from concurrent.futures import Executor
 from typing import Any, cast
 
-from pyathena.aio.util import async_retry_api_call
+from pyathena.aio.util import async_retry_api_call, get_executor
 from pyathena.error import DatabaseError, NotSupportedError, OperationalError, ProgrammingError
 from pyathena.model import (
     AthenaCalculationExecution,
@@ -59,6 +60,10 @@ class AioSparkCursor(SparkBaseCursor, WithCalculationExecution):
             **kwargs,
         )
 
+    @property
+    def _api_executor(self) -> Executor | None:
+        return get_executor(self._connection)
+
     @property
     def calculation_execution(self) -> AthenaCalculationExecution | None:
         return self._calculation_execution
@@ -74,6 +79,7 @@ class AioSparkCursor(SparkBaseCursor, WithCalculationExecution):
                 self._connection.client.get_calculation_execution_status,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
@@ -91,6 +97,7 @@ class AioSparkCursor(SparkBaseCursor, WithCalculationExecution):
                 self._connection.client.get_calculation_execution,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
@@ -117,6 +124,7 @@ class AioSparkCursor(SparkBaseCursor, WithCalculationExecution):
                 self._connection.client.start_calculation_execution,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
             calculation_id = response.get("CalculationExecutionId")
@@ -159,6 +167,7 @@ class AioSparkCursor(SparkBaseCursor, WithCalculationExecution):
                 self._connection.client.stop_calculation_execution,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
@@ -172,6 +181,7 @@ class AioSparkCursor(SparkBaseCursor, WithCalculationExecution):
                 self._connection.client.terminate_session,
                 config=self._retry_config,
                 logger=_logger,
+                executor=self._api_executor,
                 **request,
             )
         except Exception as e:
@@ -184,6 +194,7 @@ class AioSparkCursor(SparkBaseCursor, WithCalculationExecution):
             self._client.get_object,
             config=self._retry_config,
             logger=_logger,
+            executor=self._api_executor,
             Bucket=bucket,
             Key=key,
         )
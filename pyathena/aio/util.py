@@ -1,33 +1,77 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
+import functools
 import logging
 from collections.abc import Callable
+from concurrent.futures import Executor
 from typing import Any
 
 from pyathena.util import RetryConfig, retry_api_call
 
 
+def get_executor(connection: Any) -> Executor | None:
+    """Return the thread pool for the API calls of ``connection``'s cursors.
+
+    An ``AioConnection`` owns a thread pool for this. Any other connection
+    yields None, which makes the calls fall back to the event loop's default
+    executor.
+
+    Args:
+        connection: The connection the cursor or result set belongs to.
+
+    Returns:
+        The connection's executor, or None if it does not have one.
+    """
+    executor = getattr(connection, "_executor", None)
+    return executor if isinstance(executor, Executor) else None
+
+
 async def async_retry_api_call(
     func: Callable[..., Any],
     config: RetryConfig,
     logger: logging.Logger | None = None,
     *args: Any,
+    executor: Executor | None = None,
     **kwargs: Any,
 ) -> Any:
     """Execute a function with retry logic in a thread to avoid blocking the event loop.
 
-    Wraps ``retry_api_call`` with ``asyncio.to_thread()`` so that blocking
-    boto3 calls do not block the asyncio event loop.
+    Runs ``retry_api_call`` on ``executor`` so that blocking boto3 calls do not
+    block the asyncio event loop. As with ``asyncio.to_thread()``, the current
+    context variables are propagated to the worker thread.
 
     Args:
         func: The AWS API function to call.
         config: RetryConfig instance specifying retry behavior.
         logger: Optional logger for retry attempt logging.
         *args: Positional arguments to pass to ``retry_api_call``.
+        executor: Executor to run the call on. Defaults to the event loop's
+            default executor.
         **kwargs: Keyword arguments to pass to the function.
 
     Returns:
         The result of the successful function call.
     """
-    return await asyncio.to_thread(retry_api_call, func, config, logger, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, retry_api_call, func, config, logger, *args, **kwargs)
+    return await loop.run_in_executor(executor, call)
+
+
+def discard_pending(pending: asyncio.Future[Any] | None) -> None:
+    """Cancel a read-ahead request whose result is no longer needed.
+
+    A request that has already finished cannot be cancelled; its exception is
+    retrieved instead so that asyncio does not report it as never retrieved.
+
+    Args:
+        pending: The request to discard, or None.
+    """
+    if pending is None:
+        return
+    if not pending.done():
+        pending.cancel()
+    elif not pending.cancelled():
+        pending.exception()
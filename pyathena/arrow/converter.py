@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 from collections.abc import Callable
 from copy import deepcopy
@@ -27,6 +28,35 @@ _DEFAULT_ARROW_CONVERTERS: dict[str, Callable[[str | None], Any | None]] = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _get_default_dtypes() -> dict[str, type[Any]]:
+    """Build the Arrow dtype table once; each converter takes its own copy."""
+    import pyarrow as pa
+
+    return {
+        "boolean": pa.bool_(),
+        "tinyint": pa.int8(),
+        "smallint": pa.int16(),
+        "integer": pa.int32(),
+        "bigint": pa.int64(),
+        "float": pa.float32(),
+        "real": pa.float64(),
+        "double": pa.float64(),
+        "char": pa.string(),
+        "varchar": pa.string(),
+        "string": pa.string(),
+        "timestamp": pa.timestamp("ms"),
+        "date": pa.timestamp("ms"),
+        "time": pa.string(),
+        "varbinary": pa.string(),
+        "array": pa.string(),
+        "map": pa.string(),
+        "row": pa.string(),
+        "decimal": pa.string(),
+        "json": pa.string(),
+    }
+
+
 class DefaultArrowTypeConverter(Converter):
     """Optimized type converter for Apache Arrow Table results.
 
@@ -63,32 +93,7 @@ class DefaultArrowTypeConverter(Converter):
 
     @property
     def _dtypes(self) -> dict[str, type[Any]]:
-        if not hasattr(self, "__dtypes"):
-            import pyarrow as pa
-
-            self.__dtypes = {
-                "boolean": pa.bool_(),
-                "tinyint": pa.int8(),
-                "smallint": pa.int16(),
-                "integer": pa.int32(),
-                "bigint": pa.int64(),
-                "float": pa.float32(),
-                "real": pa.float64(),
-                "double": pa.float64(),
-                "char": pa.string(),
-                "varchar": pa.string(),
-                "string": pa.string(),
-                "timestamp": pa.timestamp("ms"),
-                "date": pa.timestamp("ms"),
-                "time": pa.string(),
-                "varbinary": pa.string(),
-                "array": pa.string(),
-                "map": pa.string(),
-                "row": pa.string(),
-                "decimal": pa.string(),
-                "json": pa.string(),
-            }
-        return self.__dtypes
+        return dict(_get_default_dtypes())
 
     def convert(self, type_: str, value: str | None, type_hint: str | None = None) -> Any | None:
         converter = self.get(type_)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING, Any, cast
 
 from pyathena.arrow.converter import (
@@ -17,7 +17,7 @@ from pyathena.result_set import WithFetch
 
 if TYPE_CHECKING:
     import polars as pl
-    from pyarrow import Table
+    from pyarrow import RecordBatch, Table
 
 _logger = logging.getLogger(__name__)
 
@@ -237,6 +237,33 @@ class ArrowCursor(WithFetch):
         result_set = cast(AthenaArrowResultSet, self.result_set)
         return result_set.as_arrow()
 
+    def iter_batches(self, batch_size: int | None = None) -> Iterator[RecordBatch]:
+        """Iterate over query results as Apache Arrow RecordBatches.
+
+        Unlike ``fetchmany()``, no per-row Python objects are created; each batch
+        shares its buffers with the result Table, which makes this the cheapest way
+        to hand results to Arrow-native consumers such as Polars or DuckDB.
+
+        Args:
+            batch_size: Maximum number of rows per batch. Defaults to arraysize.
+
+        Returns:
+            Iterator of RecordBatches covering all query results.
+
+        Raises:
+            ProgrammingError: If no query has been executed or no results are available.
+
+        Example:
+            >>> cursor = connection.cursor(ArrowCursor)
+            >>> cursor.execute("SELECT * FROM my_table")
+            >>> for batch in cursor.iter_batches(10_000):
+            ...     process(batch)
+        """
+        if not self.has_result_set:
+            raise ProgrammingError("No result set.")
+        result_set = cast(AthenaArrowResultSet, self.result_set)
+        return result_set.iter_batches(batch_size)
+
     def as_polars(self) -> pl.DataFrame:
         """Return query results as a Polars DataFrame.
 
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -10,7 +10,7 @@ from typing import (
 
 from pyathena import OperationalError
 from pyathena.arrow.util import to_column_info
-from pyathena.converter import Converter
+from pyathena.converter import Converter, _to_default
 from pyathena.error import ProgrammingError
 from pyathena.model import AthenaQueryExecution
 from pyathena.result_set import AthenaResultSet
@@ -18,7 +18,8 @@ from pyathena.util import RetryConfig, parse_output_location
 
 if TYPE_CHECKING:
     import polars as pl
-    from pyarrow import Table
+    from pyarrow import RecordBatch, Table
+    from pyarrow.compute import Expression
 
     from pyathena.connection import Connection
 
@@ -92,8 +93,12 @@ class AthenaArrowResultSet(AthenaResultSet):
         connect_timeout: float | None = None,
         request_timeout: float | None = None,
         result_set_type_hints: dict[str | int, str] | None = None,
+        columns: list[str] | None = None,
+        filters: Expression | list[tuple[Any, ...]] | list[list[tuple[Any, ...]]] | None = None,
         **kwargs,
     ) -> None:
+        if not unload and (columns is not None or filters is not None):
+            raise ProgrammingError("columns and filters require the unload option.")
         super().__init__(
             connection=connection,
             converter=converter,
@@ -109,6 +114,8 @@ class AthenaArrowResultSet(AthenaResultSet):
         self._unload_location = unload_location
         self._connect_timeout = connect_timeout
         self._request_timeout = request_timeout
+        self._columns = columns
+        self._filters = filters
         self._kwargs = kwargs
         self._fs = self.__s3_file_system()
         if self.state == AthenaQueryExecution.STATE_SUCCEEDED and self.output_location:
@@ -209,18 +216,36 @@ class AthenaArrowResultSet(AthenaResultSet):
         return {d[0]: self._converter.get(d[1]) for d in description}
 
     def _fetch(self) -> None:
-        try:
-            rows = next(self._batches)
-        except StopIteration:
+        for batch in self._batches:
+            if not batch.num_rows:
+                continue
+            # Convert column by column so pyarrow materializes the values in bulk
+            # and each converter is looked up once per batch instead of per cell.
+            converters = self.converters
+            columns = []
+            for name, column in zip(batch.schema.names, batch.columns, strict=False):
+                values = column.to_pylist()
+                converter = converters[name]
+                if converter is not _to_default:
+                    values = [converter(v) for v in values]
+                columns.append(values)
+            self._rows.extend(zip(*columns, strict=False))
             return
-        else:
-            dict_rows = rows.to_pydict()
-            column_names = dict_rows.keys()
-            processed_rows = [
-                tuple(self.converters[k](v) for k, v in zip(column_names, row, strict=False))
-                for row in zip(*dict_rows.values(), strict=False)
-            ]
-            self._rows.extend(processed_rows)
+
+    def needs_fetch(self) -> bool:
+        """Check whether the next ``fetchone()`` has to convert a record batch.
+
+        Returns:
+            True if no converted rows are buffered.
+        """
+        return not self._rows
+
+    def fetch_next_batch(self) -> None:
+        """Convert the next non-empty record batch into rows ready to be fetched.
+
+        Does nothing once all batches have been converted.
+        """
+        self._fetch()
 
     def fetchone(
         self,
@@ -239,25 +264,31 @@ class AthenaArrowResultSet(AthenaResultSet):
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
         if not size or size <= 0:
             size = self._arraysize
-        rows = []
-        for _ in range(size):
-            row = self.fetchone()
-            if row:
-                rows.append(row)
-            else:
-                break
+        rows: list[tuple[Any | None, ...] | dict[Any, Any | None]] = []
+        while len(rows) < size:
+            if not self._rows:
+                self._fetch()
+                if not self._rows:
+                    break
+            count = min(size - len(rows), len(self._rows))
+            rows.extend(self._rows.popleft() for _ in range(count))
+        if rows:
+            self._rownumber = (self._rownumber or 0) + len(rows)
         return rows
 
     def fetchall(
         self,
     ) -> list[tuple[Any | None, ...] | dict[Any, Any | None]]:
-        rows = []
+        rows: list[tuple[Any | None, ...] | dict[Any, Any | None]] = []
         while True:
-            row = self.fetchone()
-            if row:
-                rows.append(row)
-            else:
-                break
+            if not self._rows:
+                self._fetch()
+                if not self._rows:
+                    break
+            rows.extend(self._rows)
+            self._rows.clear()
+        if rows:
+            self._rownumber = (self._rownumber or 0) + len(rows)
         return rows
 
     def _read_csv(self) -> Table:
@@ -320,6 +351,7 @@ class AthenaArrowResultSet(AthenaResultSet):
 
     def _read_parquet(self) -> Table:
         import pyarrow as pa
+        from pyarrow import dataset as ds
         from pyarrow import parquet
 
         manifests = self._read_data_manifest()
@@ -330,8 +362,18 @@ class AthenaArrowResultSet(AthenaResultSet):
 
         bucket, key = parse_output_location(self._unload_location)
         try:
-            dataset = parquet.ParquetDataset(f"{bucket}/{key}", filesystem=self._fs)
-            return dataset.read(use_threads=True)
+            dataset = ds.dataset(f"{bucket}/{key}", filesystem=self._fs, format="parquet")
+            # Column chunks outside ``columns`` are never fetched, and row groups whose
+            # statistics cannot match ``filters`` are skipped before decoding.
+            return dataset.to_table(
+                columns=self._columns,
+                filter=(
+                    parquet.filters_to_expression(self._filters)
+                    if self._filters is not None
+                    else None
+                ),
+                use_threads=True,
+            )
         except Exception as e:
             _logger.exception(f"Failed to read {bucket}/{key}.")
             raise OperationalError(*e.args) from e
@@ -366,11 +408,28 @@ class AthenaArrowResultSet(AthenaResultSet):
     def as_arrow(self) -> Table:
         return self._table
 
+    def iter_batches(self, batch_size: int | None = None) -> Iterator[RecordBatch]:
+        """Iterate over query results as Apache Arrow RecordBatches.
+
+        The batches share their buffers with the underlying Arrow Table, so no
+        per-row Python objects are created. Iteration always covers all rows,
+        independently of any previous ``fetchone()``/``fetchmany()`` calls.
+
+        Args:
+            batch_size: Maximum number of rows per batch. Defaults to arraysize.
+
+        Returns:
+            Iterator of RecordBatches covering the whole result.
+        """
+        return iter(self._table.to_batches(max_chunksize=batch_size or self._arraysize))
+
     def as_polars(self) -> pl.DataFrame:
         """Return query results as a Polars DataFrame.
 
         Converts the Apache Arrow Table to a Polars DataFrame for
-        interoperability with the Polars data processing library.
+        interoperability with the Polars data processing library. The DataFrame
+        shares the Arrow buffers instead of copying them, so its columns may be
+        chunked; call ``rechunk()`` on the result if contiguous memory is needed.
 
         Returns:
             Polars DataFrame containing all query results.
@@ -387,7 +446,7 @@ class AthenaArrowResultSet(AthenaResultSet):
         try:
             import polars as pl
 
-            return pl.from_arrow(self._table)  # type: ignore[return-value]
+            return pl.from_arrow(self._table, rechunk=False)  # type: ignore[return-value]
         except ImportError as e:
             raise ImportError(
                 "polars is required for as_polars(). Install it with: pip install polars"
@@ -611,6 +611,9 @@ class BaseCursor(metaclass=ABCMeta):
             expiration_time = datetime.now(timezone.utc) - timedelta(seconds=cache_expiration_time)
         else:
             expiration_time = datetime.now(timezone.utc)
+        # Compared as POSIX timestamps, which avoids converting the completion
+        # time of every candidate execution to UTC.
+        expiration_timestamp = expiration_time.timestamp()
         try:
             next_token = None
             while cache_size > 0:
@@ -633,8 +636,7 @@ class BaseCursor(metaclass=ABCMeta):
                     if (
                         cache_expiration_time > 0
                         and execution.completion_date_time
-                        and execution.completion_date_time.astimezone(timezone.utc)
-                        < expiration_time
+                        and execution.completion_date_time.timestamp() < expiration_timestamp
                     ):
                         next_token = None
                         break
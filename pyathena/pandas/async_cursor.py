@@ -101,7 +101,7 @@ class AsyncPandasCursor(AsyncCursor):
     @staticmethod
     def get_default_converter(
         unload: bool = False,
-    ) -> DefaultPandasTypeConverter | Any:
+    ) -> DefaultPandasTypeConverter | DefaultPandasUnloadTypeConverter | Any:
         if unload:
             return DefaultPandasUnloadTypeConverter()
         return DefaultPandasTypeConverter()
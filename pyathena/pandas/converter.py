@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 from collections.abc import Callable
 from copy import deepcopy
@@ -25,6 +26,28 @@ _DEFAULT_PANDAS_CONVERTERS: dict[str, Callable[[str | None], Any | None]] = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _get_default_dtypes() -> dict[str, type[Any]]:
+    """Build the pandas dtype table once; each converter takes its own copy."""
+    import pandas as pd
+
+    return {
+        "tinyint": pd.Int64Dtype(),
+        "smallint": pd.Int64Dtype(),
+        "integer": pd.Int64Dtype(),
+        "bigint": pd.Int64Dtype(),
+        "float": float,
+        "real": float,
+        "double": float,
+        "char": str,
+        "varchar": str,
+        "string": str,
+        "array": str,
+        "map": str,
+        "row": str,
+    }
+
+
 class DefaultPandasTypeConverter(Converter):
     """Optimized type converter for pandas DataFrame results.
 
@@ -60,25 +83,7 @@ class DefaultPandasTypeConverter(Converter):
 
     @property
     def _dtypes(self) -> dict[str, type[Any]]:
-        if not hasattr(self, "__dtypes"):
-            import pandas as pd
-
-            self.__dtypes = {
-                "tinyint": pd.Int64Dtype(),
-                "smallint": pd.Int64Dtype(),
-                "integer": pd.Int64Dtype(),
-                "bigint": pd.Int64Dtype(),
-                "float": float,
-                "real": float,
-                "double": float,
-                "char": str,
-                "varchar": str,
-                "string": str,
-                "array": str,
-                "map": str,
-                "row": str,
-            }
-        return self.__dtypes
+        return dict(_get_default_dtypes())
 
     def convert(self, type_: str, value: str | None, type_hint: str | None = None) -> Any | None:
         converter = self.get(type_)
@@ -131,7 +131,7 @@ class PandasCursor(WithFetch):
     @staticmethod
     def get_default_converter(
         unload: bool = False,
-    ) -> DefaultPandasTypeConverter | Any:
+    ) -> DefaultPandasTypeConverter | DefaultPandasUnloadTypeConverter | Any:
         if unload:
             return DefaultPandasUnloadTypeConverter()
         return DefaultPandasTypeConverter()
@@ -1,3 +1,6 @@
+import threading
+from unittest.mock import patch
+
 import pytest
 
 from pyathena.arrow.result_set import AthenaArrowResultSet
@@ -19,6 +22,27 @@ class TestAioArrowCursor:
         assert len(await aio_arrow_cursor.fetchmany(10)) == 10
         assert len(await aio_arrow_cursor.fetchmany(10)) == 5
 
+    async def test_fetchone_converts_batches_off_loop(self, aio_arrow_cursor):
+        aio_arrow_cursor.arraysize = 10
+        await aio_arrow_cursor.execute("SELECT * FROM many_rows LIMIT 15")
+        threads = []
+        fetch_next_batch = AthenaArrowResultSet.fetch_next_batch
+
+        def record_thread(result_set):
+            threads.append(threading.current_thread().name)
+            fetch_next_batch(result_set)
+
+        with patch.object(
+            AthenaArrowResultSet, "fetch_next_batch", autospec=True, side_effect=record_thread
+        ):
+            rows = [row async for row in aio_arrow_cursor]
+        assert len(rows) == 15
+        assert aio_arrow_cursor.rownumber == 15
+        # One conversion per record batch (10 + 5 rows) plus one to detect exhaustion,
+        # all on the connection's thread pool.
+        assert len(threads) == 3
+        assert all(name.startswith("pyathena-aio") for name in threads)
+
     async def test_fetchall(self, aio_arrow_cursor):
         await aio_arrow_cursor.execute("SELECT * FROM one_row")
         assert await aio_arrow_cursor.fetchall() == [(1,)]
@@ -32,6 +56,30 @@ class TestAioArrowCursor:
         assert table.num_columns == 1
         assert table.column_names == ["number_of_rows"]
 
+    async def test_iter_batches(self, aio_arrow_cursor):
+        await aio_arrow_cursor.execute("SELECT * FROM many_rows LIMIT 15")
+        batches = list(aio_arrow_cursor.iter_batches(10))
+        assert [b.num_rows for b in batches] == [10, 5]
+        # Iteration is independent of the row fetch position.
+        assert len(await aio_arrow_cursor.fetchmany(10)) == 10
+        assert sum(b.num_rows for b in aio_arrow_cursor.iter_batches()) == 15
+
+    async def test_execute_without_prefetch(self, aio_arrow_cursor):
+        await aio_arrow_cursor.execute("SELECT * FROM many_rows LIMIT 15", prefetch=False)
+        assert aio_arrow_cursor._result_set is None
+        assert aio_arrow_cursor.has_result_set
+        with pytest.raises(ProgrammingError):
+            _ = aio_arrow_cursor.description
+        assert len(await aio_arrow_cursor.fetchmany(10)) == 10
+        assert aio_arrow_cursor._result_set is not None
+        assert [d[0] for d in aio_arrow_cursor.description] == ["a"]
+
+        await aio_arrow_cursor.execute("SELECT * FROM one_row", prefetch=False)
+        with pytest.raises(ProgrammingError):
+            aio_arrow_cursor.as_arrow()
+        await aio_arrow_cursor.materialize()
+        assert aio_arrow_cursor.as_arrow().num_rows == 1
+
     async def test_as_polars(self, aio_arrow_cursor):
         await aio_arrow_cursor.execute("SELECT * FROM one_row")
         df = aio_arrow_cursor.as_polars()
@@ -53,6 +101,8 @@ class TestAioArrowCursor:
             aio_arrow_cursor.as_arrow()
         with pytest.raises(ProgrammingError):
             aio_arrow_cursor.as_polars()
+        with pytest.raises(ProgrammingError):
+            aio_arrow_cursor.iter_batches()
 
     async def test_context_manager(self):
         from pyathena.aio.arrow.cursor import AioArrowCursor
@@ -1,5 +1,10 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
 import pytest
 
+from pyathena.aio.pandas.cursor import AioPandasCursor
 from pyathena.error import ProgrammingError
 from pyathena.pandas.result_set import AthenaPandasResultSet
 from tests import ENV
@@ -32,6 +37,32 @@ class TestAioPandasCursor:
         assert df.columns.tolist() == ["number_of_rows"]
         assert df["number_of_rows"].iloc[0] == 1
 
+    @pytest.mark.parametrize(
+        "aio_pandas_cursor",
+        [{"cursor_kwargs": {"chunksize": 5}}],
+        indirect=["aio_pandas_cursor"],
+    )
+    async def test_iter_chunks(self, aio_pandas_cursor):
+        await aio_pandas_cursor.execute("SELECT * FROM many_rows LIMIT 15")
+        chunks = [chunk async for chunk in aio_pandas_cursor.iter_chunks()]
+        assert [len(chunk) for chunk in chunks] == [5, 5, 5]
+
+    async def test_execute_without_prefetch(self, aio_pandas_cursor):
+        await aio_pandas_cursor.execute("SELECT * FROM many_rows LIMIT 15", prefetch=False)
+        assert aio_pandas_cursor._result_set is None
+        assert aio_pandas_cursor.has_result_set
+        with pytest.raises(ProgrammingError):
+            _ = aio_pandas_cursor.description
+        assert len(await aio_pandas_cursor.fetchmany(10)) == 10
+        assert aio_pandas_cursor._result_set is not None
+        assert [d[0] for d in aio_pandas_cursor.description] == ["a"]
+
+        await aio_pandas_cursor.execute("SELECT * FROM one_row", prefetch=False)
+        with pytest.raises(ProgrammingError):
+            aio_pandas_cursor.as_pandas()
+        await aio_pandas_cursor.materialize()
+        assert aio_pandas_cursor.as_pandas().shape == (1, 1)
+
     async def test_execute_returns_self(self, aio_pandas_cursor):
         result = await aio_pandas_cursor.execute("SELECT * FROM one_row")
         assert result is aio_pandas_cursor
@@ -112,3 +143,35 @@ class TestAioPandasCursor:
         await aio_pandas_cursor.execute("SELECT * FROM one_row")
         df = aio_pandas_cursor.as_pandas()
         assert len(df) == 1
+
+
+async def test_iter_chunks_reads_on_executor_and_resumes_after_break():
+    threads = []
+
+    def chunks():
+        for i in range(4):
+            threads.append(threading.current_thread().name)
+            yield i
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyathena-aio")
+    cursor = AioPandasCursor.__new__(AioPandasCursor)  # bypass __init__ to avoid AWS calls
+    cursor._connection = MagicMock()
+    cursor._connection._executor = executor
+    cursor._result_set = MagicMock()
+    cursor._result_set.iter_chunks.return_value = chunks()
+    cursor._result_set_factory = None
+    received = []
+    try:
+        async for chunk in cursor.iter_chunks():
+            received.append(chunk)
+            break
+        async for chunk in cursor.iter_chunks():
+            received.append(chunk)
+            if chunk == 2:
+                break
+        received.extend([chunk async for chunk in cursor.iter_chunks()])
+    finally:
+        executor.shutdown()
+
+    assert received == [0, 1, 2, 3]
+    assert all(name.startswith("pyathena-aio") for name in threads)
@@ -0,0 +1,570 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pyathena.aio.arrow.cursor import AioArrowCursor
+from pyathena.aio.cursor import AioCursor
+from pyathena.aio.pandas.cursor import AioPandasCursor
+from pyathena.error import OperationalError, ProgrammingError
+from pyathena.model import AthenaDatabase, AthenaQueryExecution
+from pyathena.util import RetryConfig
+
+
+async def _poll_with_timeouts(states, poll_interval, initial_poll_interval=None, poll_jitter=0.0):
+    """Poll through ``states`` without waiting and return the wait timeouts used."""
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._poll_interval = poll_interval
+    cursor._initial_poll_interval = initial_poll_interval
+    cursor._poll_jitter = poll_jitter
+    cursor._on_poll = None
+    cursor._poll_wakeups = {}
+    timeouts = []
+
+    async def wait_for(aw, timeout):
+        aw.close()
+        timeouts.append(timeout)
+        raise asyncio.TimeoutError
+
+    executions = [
+        AthenaQueryExecution(
+            {
+                "QueryExecution": {
+                    "QueryExecutionId": "test_query_id",
+                    "Query": "SELECT 1",
+                    "Status": {"State": state},
+                }
+            }
+        )
+        for state in states
+    ]
+    with (
+        patch.object(
+            AioCursor, "_get_query_execution", new_callable=AsyncMock, side_effect=executions
+        ),
+        patch("pyathena.aio.common.asyncio.wait_for", side_effect=wait_for),
+    ):
+        query_execution = await cursor._poll("test_query_id")
+    return query_execution, timeouts
+
+
+@pytest.mark.parametrize(
+    ("cursor_class", "sync_methods"),
+    [
+        (AioArrowCursor, ["as_arrow", "as_polars", "iter_batches"]),
+        (AioPandasCursor, ["as_pandas"]),
+    ],
+)
+async def test_deferred_result_set_requires_materialize(cursor_class, sync_methods):
+    result_set = MagicMock()
+    result_set.description = [("a", "integer", None, None, 10, 0, "UNKNOWN")]
+    factory = MagicMock(return_value=result_set)
+    cursor = cursor_class.__new__(cursor_class)  # bypass __init__ to avoid AWS calls
+    cursor._connection = MagicMock()
+    cursor._result_set = None
+    cursor._result_set_factory = factory
+
+    assert cursor.has_result_set
+    for name in ("result_set", "description", "rowcount", "state"):
+        with pytest.raises(ProgrammingError):
+            getattr(cursor, name)
+    for name in sync_methods:
+        with pytest.raises(ProgrammingError, match="materialize"):
+            getattr(cursor, name)()
+    factory.assert_not_called()
+
+    await cursor.materialize()
+    await cursor.materialize()
+    factory.assert_called_once_with()
+    assert cursor.result_set is result_set
+    assert cursor.description == result_set.description
+
+
+def test_cancel_wakes_poll_in_any_event_loop():
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._connection = MagicMock()
+    cursor._retry_config = RetryConfig()
+    cursor._poll_interval = 10
+    cursor._on_poll = None
+    cursor._poll_wakeups = {}
+    cursor._initial_poll_interval = None
+    cursor._poll_jitter = 0.0
+    states = {}
+
+    async def get_query_execution(query_id):
+        return AthenaQueryExecution(
+            {
+                "QueryExecution": {
+                    "QueryExecutionId": query_id,
+                    "Query": "SELECT 1",
+                    "Status": {"State": states.get(query_id, AthenaQueryExecution.STATE_RUNNING)},
+                }
+            }
+        )
+
+    async def poll_then_cancel():
+        states.clear()
+        poll = asyncio.ensure_future(cursor._poll("test_query_id"))
+        await asyncio.sleep(0.05)
+        states["test_query_id"] = AthenaQueryExecution.STATE_CANCELLED
+        await cursor._cancel("test_query_id")
+        return await asyncio.wait_for(poll, timeout=5)
+
+    with patch.object(AioCursor, "_get_query_execution", side_effect=get_query_execution):
+        # A cursor is not tied to the event loop it was first used in.
+        for _ in range(2):
+            query_execution = asyncio.run(poll_then_cancel())
+            assert query_execution.state == AthenaQueryExecution.STATE_CANCELLED
+    assert cursor._poll_wakeups == {}
+
+
+async def test_executemany_max_concurrency_rejects_unsupported_kwargs():
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    with (
+        patch.object(AioCursor, "_execute") as execute,
+        pytest.raises(ProgrammingError, match="keep_default_na"),
+    ):
+        await cursor.executemany(
+            "SELECT %(x)d", [{"x": 1}, {"x": 2}], max_concurrency=2, keep_default_na=False
+        )
+    execute.assert_not_called()
+
+
+async def test_cancel_wakes_only_the_poll_of_its_query():
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._connection = MagicMock()
+    cursor._retry_config = RetryConfig()
+    cursor._poll_interval = 10
+    cursor._initial_poll_interval = None
+    cursor._poll_jitter = 0.0
+    cursor._on_poll = None
+    cursor._poll_wakeups = {}
+    cancelled = set()
+
+    async def get_query_execution(query_id):
+        if query_id in cancelled:
+            state = AthenaQueryExecution.STATE_CANCELLED
+        else:
+            state = AthenaQueryExecution.STATE_RUNNING
+        return AthenaQueryExecution(
+            {
+                "QueryExecution": {
+                    "QueryExecutionId": query_id,
+                    "Query": "SELECT 1",
+                    "Status": {"State": state},
+                }
+            }
+        )
+
+    with patch.object(AioCursor, "_get_query_execution", side_effect=get_query_execution):
+        first = asyncio.ensure_future(cursor._poll("first"))
+        second = asyncio.ensure_future(cursor._poll("second"))
+        await asyncio.sleep(0.05)
+        cancelled.add("first")
+        await cursor._cancel("first")
+        query_execution = await asyncio.wait_for(first, timeout=5)
+        assert query_execution.state == AthenaQueryExecution.STATE_CANCELLED
+        assert not second.done()
+        assert set(cursor._poll_wakeups) == {"second"}
+        second.cancel()
+
+
+async def test_cache_size_different_schema():
+    """A cached result is only reused when it ran against the same schema (#739).
+
+    Mirrors the synchronous cursor test: identical SQL can resolve to different
+    tables depending on the database it runs against, so a prior execution from
+    another schema must not be a cache hit.
+    """
+    query = "SELECT * FROM one_row"
+
+    def execution(schema):
+        return AthenaQueryExecution(
+            {
+                "QueryExecution": {
+                    "QueryExecutionId": f"query_id_{schema}",
+                    "Query": query,
+                    "StatementType": AthenaQueryExecution.STATEMENT_TYPE_DML,
+                    "QueryExecutionContext": {"Database": schema},
+                    "Status": {
+                        "State": AthenaQueryExecution.STATE_SUCCEEDED,
+                        "CompletionDateTime": datetime.now(timezone.utc),
+                    },
+                }
+            }
+        )
+
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._catalog_name = None
+
+    with (
+        patch.object(
+            AioCursor,
+            "_list_query_execution_ids",
+            new_callable=AsyncMock,
+            return_value=(None, ["query_id"]),
+        ),
+        patch.object(
+            AioCursor,
+            "_batch_get_query_execution",
+            new_callable=AsyncMock,
+            return_value=[execution("other_schema")],
+        ),
+    ):
+        cursor._schema_name = "this_schema"
+        assert await cursor._find_previous_query_id(query, None, cache_size=100) is None
+        cursor._schema_name = "other_schema"
+        assert (
+            await cursor._find_previous_query_id(query, None, cache_size=100)
+            == "query_id_other_schema"
+        )
+
+
+async def test_cache_size_different_catalog():
+    query = "SELECT * FROM one_row"
+    schema = "this_schema"
+
+    def execution(catalog):
+        return AthenaQueryExecution(
+            {
+                "QueryExecution": {
+                    "QueryExecutionId": f"query_id_{catalog}",
+                    "Query": query,
+                    "StatementType": AthenaQueryExecution.STATEMENT_TYPE_DML,
+                    "QueryExecutionContext": {"Database": schema, "Catalog": catalog},
+                    "Status": {
+                        "State": AthenaQueryExecution.STATE_SUCCEEDED,
+                        "CompletionDateTime": datetime.now(timezone.utc),
+                    },
+                }
+            }
+        )
+
+    cursor = AioCursor.__new__(AioCursor)
+    cursor._schema_name = schema
+
+    with (
+        patch.object(
+            AioCursor,
+            "_list_query_execution_ids",
+            new_callable=AsyncMock,
+            return_value=(None, ["query_id"]),
+        ),
+        patch.object(
+            AioCursor,
+            "_batch_get_query_execution",
+            new_callable=AsyncMock,
+            return_value=[execution("awsdatacatalog")],
+        ),
+    ):
+        # A different catalog must not be a cache hit.
+        cursor._catalog_name = "other_catalog"
+        assert await cursor._find_previous_query_id(query, None, cache_size=100) is None
+        # The same catalog, differing only in case, must still be a cache hit.
+        cursor._catalog_name = "AwsDataCatalog"
+        assert (
+            await cursor._find_previous_query_id(query, None, cache_size=100)
+            == "query_id_awsdatacatalog"
+        )
+
+
+async def test_cache_lookup_prefetches_next_page():
+    """The next page of ids is listed while the current page is fetched (no AWS)."""
+    query = "SELECT * FROM one_row"
+
+    def execution(query_id, query):
+        return AthenaQueryExecution(
+            {
+                "QueryExecution": {
+                    "QueryExecutionId": query_id,
+                    "Query": query,
+                    "StatementType": AthenaQueryExecution.STATEMENT_TYPE_DML,
+                    "QueryExecutionContext": {"Database": "this_schema"},
+                    "Status": {
+                        "State": AthenaQueryExecution.STATE_SUCCEEDED,
+                        "CompletionDateTime": datetime.now(timezone.utc),
+                    },
+                }
+            }
+        )
+
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._schema_name = "this_schema"
+    cursor._catalog_name = None
+    events = []
+
+    async def list_ids(work_group, next_token=None, max_results=None):
+        events.append(("list", next_token))
+        page = 0 if next_token is None else int(next_token)
+        return str(page + 1), [f"id_{page}"]
+
+    async def batch_get(query_ids):
+        events.append(("get", query_ids[0]))
+        await asyncio.sleep(0)
+        if query_ids == ["id_1"]:
+            return [execution("id_1", query)]
+        return [execution(query_ids[0], "SELECT 1")]
+
+    with (
+        patch.object(AioCursor, "_list_query_execution_ids", side_effect=list_ids),
+        patch.object(AioCursor, "_batch_get_query_execution", side_effect=batch_get),
+    ):
+        assert await cursor._find_previous_query_id(query, None, cache_size=150) == "id_1"
+
+    assert events == [
+        ("list", None),
+        ("get", "id_0"),
+        ("list", "1"),
+        ("get", "id_1"),
+        ("list", "2"),
+    ]
+
+
+async def test_poll_backoff():
+    """Poll waits start short and double up to ``poll_interval`` (no AWS)."""
+    query_execution, timeouts = await _poll_with_timeouts(
+        [*[AthenaQueryExecution.STATE_RUNNING] * 4, AthenaQueryExecution.STATE_SUCCEEDED],
+        poll_interval=0.3,
+        initial_poll_interval=0.05,
+    )
+
+    assert query_execution.state == AthenaQueryExecution.STATE_SUCCEEDED
+    assert timeouts == [0.05, 0.1, 0.2, 0.3]
+
+
+async def test_poll_interval_default():
+    """Without the backoff options, polls wait ``poll_interval`` (no AWS)."""
+    _, timeouts = await _poll_with_timeouts(
+        [*[AthenaQueryExecution.STATE_QUEUED] * 2, AthenaQueryExecution.STATE_SUCCEEDED],
+        poll_interval=0.3,
+    )
+
+    assert timeouts == [0.3, 0.3]
+
+
+async def test_api_calls_run_on_connection_executor():
+    """API calls run on the connection's thread pool when it has one (no AWS)."""
+    threads = []
+
+    def get_query_execution(**kwargs):
+        threads.append(threading.current_thread().name)
+        return {
+            "QueryExecution": {
+                "QueryExecutionId": kwargs["QueryExecutionId"],
+                "Query": "SELECT 1",
+                "Status": {"State": AthenaQueryExecution.STATE_SUCCEEDED},
+            }
+        }
+
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyathena-aio")
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._connection = MagicMock()
+    cursor._connection._executor = executor
+    cursor._connection.client.get_query_execution.side_effect = get_query_execution
+    cursor._retry_config = RetryConfig()
+    try:
+        query_execution = await cursor._get_query_execution("test_query_id")
+    finally:
+        executor.shutdown()
+
+    assert query_execution.query_id == "test_query_id"
+    assert len(threads) == 1
+    assert threads[0].startswith("pyathena-aio")
+
+
+async def test_run_in_executor_uses_connection_executor():
+    """Blocking work runs on the connection's thread pool (no AWS)."""
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyathena-aio")
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._connection = MagicMock()
+    cursor._connection._executor = executor
+    try:
+        thread_name = await cursor._run_in_executor(lambda: threading.current_thread().name)
+    finally:
+        executor.shutdown()
+
+    assert thread_name.startswith("pyathena-aio")
+
+
+async def test_poll_backoff_resets_on_state_change():
+    """The poll interval starts over when the query state changes (no AWS)."""
+    _, timeouts = await _poll_with_timeouts(
+        [
+            *[AthenaQueryExecution.STATE_QUEUED] * 3,
+            *[AthenaQueryExecution.STATE_RUNNING] * 2,
+            AthenaQueryExecution.STATE_SUCCEEDED,
+        ],
+        poll_interval=1,
+        initial_poll_interval=0.05,
+    )
+
+    assert timeouts == [0.05, 0.1, 0.2, 0.05, 0.1]
+
+
+async def test_poll_jitter():
+    """Poll waits are stretched by up to ``POLL_JITTER`` (no AWS)."""
+    _, timeouts = await _poll_with_timeouts(
+        [*[AthenaQueryExecution.STATE_RUNNING] * 20, AthenaQueryExecution.STATE_SUCCEEDED],
+        poll_interval=1,
+        poll_jitter=0.1,
+    )
+
+    assert all(1 <= t <= 1.1 for t in timeouts)
+    assert len(set(timeouts)) > 1
+
+
+async def test_executemany_max_concurrency():
+    """Queries run concurrently up to ``max_concurrency`` (no AWS)."""
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._query_id = None
+    cursor._result_set = None
+    cursor._on_start_query_execution = None
+    running = 0
+    max_running = 0
+
+    async def poll(query_id):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return AthenaQueryExecution(
+            {
+                "QueryExecution": {
+                    "QueryExecutionId": query_id,
+                    "Query": "SELECT 1",
+                    "Status": {"State": "SUCCEEDED"},
+                }
+            }
+        )
+
+    with (
+        patch.object(
+            AioCursor, "_execute", new_callable=AsyncMock, side_effect=lambda op, **kw: op
+        ) as execute,
+        patch.object(AioCursor, "_poll", side_effect=poll),
+    ):
+        await cursor.executemany("SELECT %(x)d", [{"x": i} for i in range(10)], max_concurrency=3)
+
+    assert execute.call_count == 10
+    assert max_running == 3
+    assert cursor.query_id is None
+    assert cursor.result_set is None
+
+
+async def test_executemany_max_concurrency_failure():
+    """A failed query raises and cancels the remaining ones (no AWS)."""
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._query_id = None
+    cursor._result_set = None
+    cursor._on_start_query_execution = None
+
+    async def poll(query_id):
+        if query_id != "fail":
+            await asyncio.sleep(10)
+        return AthenaQueryExecution(
+            {
+                "QueryExecution": {
+                    "QueryExecutionId": query_id,
+                    "Query": "SELECT 1",
+                    "Status": {"State": "FAILED", "StateChangeReason": "boom"},
+                }
+            }
+        )
+
+    with (
+        patch.object(
+            AioCursor,
+            "_execute",
+            new_callable=AsyncMock,
+            side_effect=lambda op, parameters, **kw: parameters["id"],
+        ),
+        patch.object(AioCursor, "_poll", side_effect=poll),
+        pytest.raises(OperationalError, match="boom"),
+    ):
+        await asyncio.wait_for(
+            cursor.executemany(
+                "SELECT %(id)s", [{"id": "slow"}, {"id": "fail"}], max_concurrency=2
+            ),
+            timeout=5,
+        )
+
+
+async def test_executemany_max_concurrency_failure_stops_queries():
+    """Queries still running or being submitted are stopped on failure (no AWS)."""
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    cursor._query_id = None
+    cursor._result_set = None
+    cursor._on_start_query_execution = None
+
+    submitted = []
+
+    async def execute(operation, parameters, **kwargs):
+        if parameters["id"] == "submitting":
+            await asyncio.sleep(0.05)
+        submitted.append(parameters["id"])
+        return parameters["id"]
+
+    async def poll(query_id):
+        if query_id != "fail":
+            await asyncio.sleep(10)
+        return AthenaQueryExecution(
+            {
+                "QueryExecution": {
+                    "QueryExecutionId": query_id,
+                    "Query": "SELECT 1",
+                    "Status": {"State": "FAILED", "StateChangeReason": "boom"},
+                }
+            }
+        )
+
+    with (
+        patch.object(AioCursor, "_execute", side_effect=execute),
+        patch.object(AioCursor, "_poll", side_effect=poll),
+        patch.object(AioCursor, "_cancel", new_callable=AsyncMock) as cancel,
+        pytest.raises(OperationalError, match="boom"),
+    ):
+        await asyncio.wait_for(
+            cursor.executemany(
+                "SELECT %(id)s",
+                [{"id": "running"}, {"id": "submitting"}, {"id": "fail"}, {"id": "queued"}],
+                max_concurrency=3,
+            ),
+            timeout=5,
+        )
+
+    cancelled = {c.args[0] for c in cancel.await_args_list}
+    assert {"running", "submitting"} <= cancelled
+    assert cancelled == set(submitted) - {"fail"}
+
+
+async def test_iter_databases_prefetches_next_page():
+    """The next page is requested before the current one is consumed (no AWS)."""
+    cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
+    events = []
+
+    async def list_databases(catalog_name, next_token=None, max_results=None):
+        events.append(("list", next_token))
+        page = 0 if next_token is None else int(next_token)
+        databases = [AthenaDatabase({"Database": {"Name": f"db_{page}"}})]
+        return (str(page + 1) if page < 2 else None), databases
+
+    names = []
+    with patch.object(AioCursor, "_list_databases", side_effect=list_databases):
+        async for database in cursor.iter_databases("catalog"):
+            await asyncio.sleep(0)
+            events.append(("consume", database.name))
+            names.append(database.name)
+
+    assert names == ["db_0", "db_1", "db_2"]
+    assert events == [
+        ("list", None),
+        ("list", "1"),
+        ("consume", "db_0"),
+        ("list", "2"),
+        ("consume", "db_1"),
+        ("consume", "db_2"),
+    ]
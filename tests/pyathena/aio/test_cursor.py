@@ -1,5 +1,5 @@
 import re
-from datetime import datetime, timezone
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -130,87 +130,6 @@ class TestAioCursor:
             cache_expiration_time=100,
         )
 
-    async def test_cache_size_different_schema(self):
-        """A cached result is only reused when it ran against the same schema (#739).
-
-        Mirrors the synchronous cursor test: identical SQL can resolve to different
-        tables depending on the database it runs against, so a prior execution from
-        another schema must not be a cache hit.
-        """
-        query = "SELECT * FROM one_row"
-
-        def execution(schema):
-            return AthenaQueryExecution(
-                {
-                    "QueryExecution": {
-                        "QueryExecutionId": f"query_id_{schema}",
-                        "Query": query,
-                        "StatementType": AthenaQueryExecution.STATEMENT_TYPE_DML,
-                        "QueryExecutionContext": {"Database": schema},
-                        "Status": {
-                            "State": AthenaQueryExecution.STATE_SUCCEEDED,
-                            "CompletionDateTime": datetime.now(timezone.utc),
-                        },
-                    }
-                }
-            )
-
-        cursor = AioCursor.__new__(AioCursor)  # bypass __init__ to avoid AWS calls
-        cursor._catalog_name = None
-
-        with patch.object(
-            AioCursor,
-            "_list_query_executions",
-            new_callable=AsyncMock,
-            return_value=(None, [execution("other_schema")]),
-        ):
-            cursor._schema_name = "this_schema"
-            assert await cursor._find_previous_query_id(query, None, cache_size=100) is None
-            cursor._schema_name = "other_schema"
-            assert (
-                await cursor._find_previous_query_id(query, None, cache_size=100)
-                == "query_id_other_schema"
-            )
-
-    async def test_cache_size_different_catalog(self):
-        query = "SELECT * FROM one_row"
-        schema = "this_schema"
-
-        def execution(catalog):
-            return AthenaQueryExecution(
-                {
-                    "QueryExecution": {
-                        "QueryExecutionId": f"query_id_{catalog}",
-                        "Query": query,
-                        "StatementType": AthenaQueryExecution.STATEMENT_TYPE_DML,
-                        "QueryExecutionContext": {"Database": schema, "Catalog": catalog},
-                        "Status": {
-                            "State": AthenaQueryExecution.STATE_SUCCEEDED,
-                            "CompletionDateTime": datetime.now(timezone.utc),
-                        },
-                    }
-                }
-            )
-
-        cursor = AioCursor.__new__(AioCursor)
-        cursor._schema_name = schema
-
-        with patch.object(
-            AioCursor,
-            "_list_query_executions",
-            new_callable=AsyncMock,
-            return_value=(None, [execution("awsdatacatalog")]),
-        ):
-            # A different catalog must not be a cache hit.
-            cursor._catalog_name = "other_catalog"
-            assert await cursor._find_previous_query_id(query, None, cache_size=100) is None
-            # The same catalog, differing only in case, must still be a cache hit.
-            cursor._catalog_name = "AwsDataCatalog"
-            assert (
-                await cursor._find_previous_query_id(query, None, cache_size=100)
-                == "query_id_awsdatacatalog"
-            )
-
     async def test_no_result_set_raises(self, aio_cursor):
         with pytest.raises(ProgrammingError):
             await aio_cursor.fetchone()
@@ -343,6 +262,14 @@ class TestAioCursor:
         table_names = [m.name for m in metadata_list]
         assert "one_row" in table_names
 
+    async def test_iter_table_metadata(self, aio_cursor):
+        table_names = [m.name async for m in aio_cursor.iter_table_metadata()]
+        assert "one_row" in table_names
+
+    async def test_iter_databases(self, aio_cursor):
+        databases = [d.name async for d in aio_cursor.iter_databases("AwsDataCatalog")]
+        assert ENV.schema in databases
+
 
 class TestAioDictCursor:
     async def test_fetchone(self, aio_dict_cursor):
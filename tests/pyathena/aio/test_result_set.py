@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock
+
+from pyathena.aio.result_set import AthenaAioResultSet
+from pyathena.converter import DefaultTypeConverter
+from pyathena.model import AthenaQueryExecution
+from pyathena.util import RetryConfig
+
+
+async def test_fetch_across_pages():
+    """Pages are drained in bulk and requested one ahead (no AWS)."""
+
+    def page(start, count, next_token):
+        rows = [{"Data": [{"VarCharValue": str(i)}]} for i in range(start, start + count)]
+        if start == 0:
+            rows.insert(0, {"Data": [{"VarCharValue": "a"}]})
+        response = {
+            "ResultSet": {
+                "ResultSetMetadata": {"ColumnInfo": [{"Name": "a", "Type": "integer"}]},
+                "Rows": rows,
+            }
+        }
+        if next_token:
+            response["NextToken"] = next_token
+        return response
+
+    pages = {None: page(0, 3, "1"), "1": page(3, 3, "2"), "2": page(6, 3, None)}
+    requested = []
+
+    def get_query_results(**kwargs):
+        requested.append(kwargs.get("NextToken"))
+        return pages[kwargs.get("NextToken")]
+
+    connection = MagicMock()
+    connection._executor = None
+    connection.client.get_query_results.side_effect = get_query_results
+    query_execution = AthenaQueryExecution(
+        {
+            "QueryExecution": {
+                "QueryExecutionId": "test_query_id",
+                "Query": "SELECT a FROM t",
+                "Status": {"State": AthenaQueryExecution.STATE_SUCCEEDED},
+            }
+        }
+    )
+    result_set = await AthenaAioResultSet.create(
+        connection, DefaultTypeConverter(), query_execution, 3, RetryConfig()
+    )
+
+    assert await result_set.fetchone() == (0,)
+    assert await result_set.fetchmany(4) == [(1,), (2,), (3,), (4,)]
+    assert result_set.rownumber == 5
+    # The last page is already being requested while the second is consumed.
+    assert result_set._pending_fetch is not None
+    assert await result_set.fetchall() == [(5,), (6,), (7,), (8,)]
+    assert result_set.rownumber == 9
+    assert await result_set.fetchall() == []
+    assert await result_set.fetchone() is None
+    assert requested == [None, "1", "2"]
@@ -9,6 +9,7 @@ from decimal import Decimal
 import pandas as pd
 import polars as pl
 import pyarrow as pa
+import pyarrow.compute as pc
 import pytest
 
 from pyathena.arrow.cursor import ArrowCursor
@@ -41,6 +42,15 @@ class TestArrowCursor:
         assert len(arrow_cursor.fetchmany(10)) == 10
         assert len(arrow_cursor.fetchmany(10)) == 5
 
+    def test_fetchmany_across_batches(self, arrow_cursor):
+        arrow_cursor.arraysize = 4
+        arrow_cursor.execute("SELECT a FROM many_rows ORDER BY a LIMIT 10")
+        assert arrow_cursor.fetchone() == (0,)
+        assert arrow_cursor.fetchmany(6) == [(i,) for i in range(1, 7)]
+        assert arrow_cursor.rownumber == 7
+        assert arrow_cursor.fetchall() == [(7,), (8,), (9,)]
+        assert arrow_cursor.rownumber == 10
+
     @pytest.mark.parametrize(
         "arrow_cursor",
         [{"cursor_kwargs": {"unload": False}}, {"cursor_kwargs": {"unload": True}}],
@@ -273,6 +283,33 @@ class TestArrowCursor:
         assert table.shape[1] == 1
         assert list(zip(*table.to_pydict().values(), strict=False)) == [(i,) for i in range(10000)]
 
+    @pytest.mark.parametrize(
+        "arrow_cursor",
+        [{"cursor_kwargs": {"unload": False}}, {"cursor_kwargs": {"unload": True}}],
+        indirect=["arrow_cursor"],
+    )
+    def test_iter_batches(self, arrow_cursor):
+        arrow_cursor.execute("SELECT * FROM many_rows")
+        batches = list(arrow_cursor.iter_batches(3000))
+        assert all(b.num_rows <= 3000 for b in batches)
+        assert sorted(v for b in batches for v in b.column(0).to_pylist()) == list(range(10000))
+
+    @pytest.mark.parametrize(
+        "arrow_cursor",
+        [{"cursor_kwargs": {"unload": True}}],
+        indirect=["arrow_cursor"],
+    )
+    @pytest.mark.parametrize("filters", [pc.field("b") < 10, [("b", "<", 10)]])
+    def test_as_arrow_unload_columns_and_filters(self, arrow_cursor, filters):
+        table = arrow_cursor.execute(
+            "SELECT a, a * 2 AS b FROM many_rows",
+            columns=["b"],
+            filters=filters,
+        ).as_arrow()
+        assert table.column_names == ["b"]
+        assert sorted(table.column("b").to_pylist()) == [0, 2, 4, 6, 8]
+        assert [d[0] for d in arrow_cursor.description] == ["b"]
+
     def test_complex_as_arrow(self, arrow_cursor):
         table = arrow_cursor.execute(
             """
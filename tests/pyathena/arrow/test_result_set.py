@@ -0,0 +1,27 @@
+from unittest.mock import MagicMock
+
+import pyarrow.compute as pc
+import pytest
+
+from pyathena.arrow.converter import DefaultArrowTypeConverter
+from pyathena.arrow.result_set import AthenaArrowResultSet
+from pyathena.error import ProgrammingError
+from pyathena.util import RetryConfig
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"columns": ["a"]}, {"filters": pc.field("a") < 1}, {"filters": [("a", "<", 1)]}],
+)
+def test_columns_and_filters_require_unload(kwargs):
+    connection = MagicMock()
+    with pytest.raises(ProgrammingError, match="unload"):
+        AthenaArrowResultSet(
+            connection=connection,
+            converter=DefaultArrowTypeConverter(),
+            query_execution=MagicMock(),
+            arraysize=1,
+            retry_config=RetryConfig(),
+            **kwargs,
+        )
+    connection.client.get_query_results.assert_not_called()
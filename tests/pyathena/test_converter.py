@@ -1,11 +1,13 @@
 import pytest
 
+from pyathena.arrow.converter import DefaultArrowTypeConverter
 from pyathena.converter import (
     DefaultTypeConverter,
     _to_array,
     _to_map,
     _to_struct,
 )
+from pyathena.pandas.converter import DefaultPandasTypeConverter
 
 
 @pytest.mark.parametrize(
@@ -455,3 +457,16 @@ class TestDefaultTypeConverter:
             type_hint="array<row(a int, b varchar)>",
         )
         assert result == [{"a": 1, "b": "hello"}]
+
+
+@pytest.mark.parametrize(
+    "converter_class",
+    [DefaultArrowTypeConverter, DefaultPandasTypeConverter],
+)
+def test_default_converters_do_not_share_state(converter_class):
+    converter = converter_class()
+    other = converter_class()
+    converter.set("varchar", lambda value: "custom")
+    converter.types.clear()
+    assert other.convert("varchar", "hello") == "hello"
+    assert other.get_dtype("bigint") is not None
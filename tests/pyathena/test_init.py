@@ -0,0 +1,39 @@
+import pytest
+
+import pyathena
+from pyathena import BINARY, NUMBER, STRING, DBAPITypeObject
+
+
+@pytest.mark.parametrize(
+    ("type_object", "type_name", "expected"),
+    [
+        (STRING, "varchar", True),
+        (STRING, "char", True),
+        (STRING, "bigint", False),
+        (NUMBER, "bigint", True),
+        (NUMBER, "varchar", False),
+        (BINARY, "varbinary", True),
+    ],
+)
+def test_type_object_compare_with_type_name(type_object, type_name, expected):
+    assert (type_object == type_name) is expected
+    assert (type_object != type_name) is not expected
+    assert (type_name == type_object) is expected
+
+
+def test_type_object_compare_with_type_object():
+    assert DBAPITypeObject(("char", "varchar", "map", "array", "row")) == STRING
+    assert STRING != NUMBER
+    assert not STRING == NUMBER  # noqa: SIM201
+
+
+def test_type_object_compare_with_other():
+    assert STRING != None  # noqa: E711
+    assert not STRING == 1  # noqa: SIM201
+
+
+def test_type_objects_star_import():
+    namespace: dict[str, object] = {}
+    exec("from pyathena import *", namespace)
+    assert namespace["STRING"] is pyathena.STRING
+    assert isinstance(namespace["JSON"], DBAPITypeObject)